@@ -72,7 +72,7 @@ def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
         "--cycle-limit",
         type=int,
         help=(
-            "Override the number of unique states tracked for cycle detection "
+            "Override the longest loop, in steps, that cycle detection tracks "
             f"(default: {DEFAULT_CYCLE_DETECTION_LIMIT})."
         ),
     )
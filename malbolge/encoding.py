@@ -3,7 +3,6 @@
 
 from __future__ import annotations
 
-import functools
 from collections.abc import Iterable
 
 NORMAL_TRANSLATE = (
@@ -14,6 +13,12 @@ ENCRYPTION_TRANSLATE = (
     "5z]&gqtyfr$(we4{WP)H-Zn,[%\\3dL+Q;>U!pJS72FhOA1CB6v^=I_0/8|jsb9m<.TVa"
     "c`uY*MK'X~xDl}REokN:#?G\"i@"
 )
+# Encrypted value of every byte: ENCRYPTION_TRANSLATE inside the printable
+# range [33, 126], the byte itself elsewhere.
+ENCRYPTION_LUT = bytes(
+    ord(ENCRYPTION_TRANSLATE[value - 33]) if 33 <= value <= 126 else value
+    for value in range(256)
+)
 VALID_INSTRUCTIONS = "i</*jpov"
 MAX_PROGRAM_LENGTH = 59049
 
@@ -42,9 +47,14 @@ def normalize(instruction_list: Iterable[str]) -> list[str]:
     return list(return_string)
 
 
-@functools.cache
-def _opcode_offset(opcode: str, index: int) -> int:
-    return (NORMAL_TRANSLATE.index(opcode) - index) % 94
+# ASCII encoding of each opcode at every position modulo 94: row ``op`` holds
+# chr((NORMAL_TRANSLATE.index(op) - index) % 94 + 33) at slot ``index % 94``.
+_ENCODING_ROWS = {
+    opcode: "".join(
+        chr((NORMAL_TRANSLATE.index(opcode) - index) % 94 + 33) for index in range(94)
+    )
+    for opcode in VALID_INSTRUCTIONS
+}
 
 
 def reverse_normalize(
@@ -58,12 +68,13 @@ def reverse_normalize(
     if total_length > MAX_PROGRAM_LENGTH:
         raise InvalidProgramError("Program exceeds Malbolge maximum length (59049).")
 
-    return_string = ""
-    for offset, char in enumerate(instruction_list):
-        if char not in VALID_INSTRUCTIONS:
+    rows = _ENCODING_ROWS
+    encoded: list[str] = []
+    append = encoded.append
+    for index, char in enumerate(instruction_list, start_index):
+        row = rows.get(char)
+        if row is None:
             raise InvalidProgramError("Invalid opcode encountered during decoding.")
-        index = start_index + offset
-        translated = chr(_opcode_offset(char, index) + 33)
-        return_string += translated
+        append(row[index % 94])
 
-    return list(return_string)
+    return encoded
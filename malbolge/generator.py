@@ -10,7 +10,11 @@ hooks for determinism and performance tuning.
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from random import Random
 from time import perf_counter_ns
 
@@ -22,6 +26,9 @@ from .interpreter import (
 )
 
 SIGNATURE_TAPE_WIDTH = 8
+# Largest search layer kept as a cached template; deeper layers over wide
+# alphabets are rebuilt from their filtered parents instead of pinned.
+_FRONTIER_TEMPLATE_LIMIT = 4096
 StateSignature = tuple[int, int, int, int, tuple[int, ...]]
 
 logger = logging.getLogger(__name__)
@@ -34,6 +41,8 @@ class GenerationConfig:
     random_seed: int | None = None
     max_program_length: int = 59049
     capture_trace: bool = False
+    state_cache_capacity: int | None = 4096
+    parallel_workers: int | None = None
 
 
 @dataclass(slots=True)
@@ -64,9 +73,70 @@ class _GenerationStats:
     repeated_state_pruned: int = 0
 
 
+_WORKER_INTERPRETER: MalbolgeInterpreter | None = None
+
+
+def _init_extension_worker(
+    allow_memory_expansion: bool,
+    memory_limit: int,
+    cycle_detection_limit: int | None,
+) -> None:
+    global _WORKER_INTERPRETER
+    _WORKER_INTERPRETER = MalbolgeInterpreter(
+        allow_memory_expansion=allow_memory_expansion,
+        memory_limit=memory_limit,
+        cycle_detection_limit=cycle_detection_limit,
+        thread_safe=False,
+    )
+
+
+def _extend_in_worker(
+    machine: MalbolgeMachine, suffix: str
+) -> tuple[str, MalbolgeMachine] | None:
+    interpreter = _WORKER_INTERPRETER or MalbolgeInterpreter()
+    try:
+        result = interpreter.execute_from_snapshot(
+            machine,
+            suffix,
+            capture_machine=True,
+        )
+    except MalbolgeRuntimeError:
+        return None
+    if result.machine is None:
+        return None
+    return result.output, result.machine
+
+
 class ProgramGenerator:
     def __init__(self, interpreter: MalbolgeInterpreter | None = None) -> None:
         self._interpreter = interpreter or MalbolgeInterpreter()
+        self._frontier_templates: dict[str, list[tuple[str, ...]]] = {}
+
+    def _frontier_template(
+        self, opcode_choices: str, depth: int
+    ) -> tuple[str, ...] | None:
+        """
+        Return every length-``depth`` suffix over ``opcode_choices``.
+
+        Templates are built lazily and cached per alphabet so unfiltered search
+        layers can be reused across target indices instead of re-materialised.
+        Layers larger than ``_FRONTIER_TEMPLATE_LIMIT`` are not cached and yield
+        ``None``.
+        """
+        if len(opcode_choices) ** depth > _FRONTIER_TEMPLATE_LIMIT:
+            return None
+        templates = self._frontier_templates.setdefault(opcode_choices, [])
+        while len(templates) < depth:
+            if templates:
+                previous = templates[-1]
+                templates.append(
+                    tuple(
+                        base + opcode for base in previous for opcode in opcode_choices
+                    )
+                )
+            else:
+                templates.append(tuple(opcode_choices))
+        return templates[depth - 1]
 
     @staticmethod
     def _state_signature(
@@ -98,15 +168,52 @@ class ProgramGenerator:
             raise ValueError("Target string must not be empty.")
 
         cfg = config or GenerationConfig()
+        if cfg.state_cache_capacity is not None and cfg.state_cache_capacity < 1:
+            raise ValueError("state_cache_capacity must be positive or None.")
+        if cfg.parallel_workers is not None and cfg.parallel_workers < 1:
+            raise ValueError("parallel_workers must be positive or None.")
+        if cfg.parallel_workers is None or cfg.parallel_workers == 1:
+            return self._search(target, cfg, None)
+
+        interpreter = self._interpreter
+        with ProcessPoolExecutor(
+            max_workers=cfg.parallel_workers,
+            initializer=_init_extension_worker,
+            initargs=(
+                interpreter._allow_memory_expansion,
+                interpreter._memory_limit,
+                interpreter._cycle_detection_limit,
+            ),
+        ) as pool:
+            return self._search(target, cfg, pool)
+
+    def _search(
+        self,
+        target: str,
+        cfg: GenerationConfig,
+        pool: ProcessPoolExecutor | None,
+    ) -> GenerationResult:
         rng = Random(cfg.random_seed)
         interpreter = self._interpreter
         stats = _GenerationStats()
-        state_cache: dict[str, _PrefixState] = {}
+        state_cache: OrderedDict[str, _PrefixState] = OrderedDict()
         dead_programs: set[str] = set()
         seen_states: dict[tuple[int, int, int, int, tuple[int, ...]], int] = {}
         canonical_signatures: dict[StateSignature, int] = {}
         signature_collisions = 0
         trace_events: list[dict[str, object]] | None = [] if cfg.capture_trace else None
+        base_choices = self._frontier_template(cfg.opcode_choices, 1) or tuple(
+            cfg.opcode_choices
+        )
+        # The candidate loop runs per suffix per depth; bind the attribute and
+        # method lookups it repeats once up front.
+        fallback_signature = self._fallback_signature
+        state_signature = self._state_signature
+        get_or_extend_state = self._get_or_extend_state
+        matches_target = target.startswith
+        mark_dead = dead_programs.add
+        seen_states_get = seen_states.get
+        canonical_signatures_get = canonical_signatures.get
         started_ns = perf_counter_ns()
 
         prefix = "i" + "o" * 99  # Legacy bootstrap sequence
@@ -126,9 +233,9 @@ class ProgramGenerator:
             machine=prefix_result.machine,
         )
         state_cache[prefix_state.opcodes] = prefix_state
-        fallback_prefix = self._fallback_signature(prefix_state.machine)
+        fallback_prefix = fallback_signature(prefix_state.machine)
         seen_states[fallback_prefix] = len(prefix_state.output)
-        canonical_signatures[self._state_signature(prefix_state.machine)] = len(
+        canonical_signatures[state_signature(prefix_state.machine)] = len(
             prefix_state.output
         )
 
@@ -140,7 +247,7 @@ class ProgramGenerator:
             reason: str,
             cache_hit: bool,
             depth_level: int,
-            target_prefix: str,
+            expected_length: int,
         ) -> None:
             logger.debug(
                 "generation_trace_event",
@@ -156,7 +263,7 @@ class ProgramGenerator:
                 return
             trace_events.append(
                 {
-                    "target_prefix": target_prefix,
+                    "target_prefix": target[:expected_length],
                     "candidate": candidate,
                     "output": output,
                     "pruned": pruned,
@@ -170,12 +277,23 @@ class ProgramGenerator:
 
         for index in range(len(target)):
             found = False
-            combinations = list(cfg.opcode_choices)
+            combinations: Sequence[str] = base_choices
             depth = 0
-            target_prefix = target[: index + 1]
+            expected_length = index + 1
 
             while not found:
                 depth += 1
+                prefetched: dict[str, _PrefixState] | None = None
+                if pool is not None:
+                    prefetched = self._prefetch_layer(
+                        pool,
+                        prefix_state,
+                        combinations,
+                        cfg,
+                        state_cache,
+                        dead_programs,
+                        stats,
+                    )
                 for candidate in combinations:
                     suffix = candidate + "<"
                     program_key = prefix_state.opcodes + suffix
@@ -188,78 +306,78 @@ class ProgramGenerator:
                             reason="dead_program_cache",
                             cache_hit=False,
                             depth_level=depth,
-                            target_prefix=target_prefix,
+                            expected_length=expected_length,
                         )
                         continue
-                    combined_state, from_cache = self._get_or_extend_state(
+                    combined_state, from_cache = get_or_extend_state(
                         prefix_state,
                         suffix,
                         interpreter,
                         cfg,
                         state_cache,
                         stats,
+                        prefetched,
                     )
                     if combined_state.machine is None:
                         raise MalbolgeRuntimeError(
                             "Generator requires machine snapshots for heuristics."
                         )
-                    signature = self._state_signature(combined_state.machine)
-                    fallback_key = self._fallback_signature(combined_state.machine)
                     output_value = combined_state.output
                     output_length = len(output_value)
-                    known_output_length = seen_states.get(fallback_key)
-                    is_new_state = (
-                        known_output_length is None
-                        or output_length > known_output_length
-                    )
-                    previous_signature_output = canonical_signatures.get(signature)
-                    is_new_by_signature = (
-                        previous_signature_output is None
-                        or output_length > previous_signature_output
-                    )
-                    valid_prefix = target.startswith(output_value) and (
-                        output_length <= len(target)
-                    )
+                    # startswith() already rejects outputs longer than the target,
+                    # and mismatches never reach the state bookkeeping below, so
+                    # reject them before paying for signature construction.
+                    valid_prefix = matches_target(output_value)
 
                     pruned = False
                     reason = "candidate_retained"
 
-                    if valid_prefix and output_value == target_prefix:
-                        seen_states[fallback_key] = max(
-                            known_output_length or 0, output_length
-                        )
-                        canonical_signatures[signature] = max(
-                            previous_signature_output or 0, output_length
-                        )
-                        prefix_state = combined_state
-                        found = True
-                        reason = "accepted"
-                    elif not valid_prefix:
+                    if not valid_prefix:
                         stats.pruned += 1
-                        dead_programs.add(program_key)
+                        mark_dead(program_key)
                         pruned = True
                         reason = "prefix_mismatch"
-                    elif not is_new_state:
-                        stats.pruned += 1
-                        stats.repeated_state_pruned += 1
-                        dead_programs.add(program_key)
-                        state_cache.pop(program_key, None)
-                        pruned = True
-                        reason = "repeated_state"
                     else:
-                        if not is_new_by_signature:
-                            signature_collisions += 1
-                            reason = "signature_collision"
-                        if (
+                        fallback_key = fallback_signature(combined_state.machine)
+                        known_output_length = seen_states_get(fallback_key)
+                        is_new_state = (
                             known_output_length is None
                             or output_length > known_output_length
-                        ):
-                            seen_states[fallback_key] = output_length
-                        if (
-                            previous_signature_output is None
-                            or output_length > previous_signature_output
-                        ):
-                            canonical_signatures[signature] = output_length
+                        )
+                        # valid_prefix holds here, so a length match means the
+                        # output equals target[:expected_length] without slicing.
+                        is_target_prefix = output_length == expected_length
+
+                        if not is_target_prefix and not is_new_state:
+                            stats.pruned += 1
+                            stats.repeated_state_pruned += 1
+                            mark_dead(program_key)
+                            state_cache.pop(program_key, None)
+                            pruned = True
+                            reason = "repeated_state"
+                        else:
+                            # Only the exact-state index drives pruning; canonical
+                            # signatures feed collision accounting, so they are
+                            # consulted once a candidate survives that check.
+                            signature = state_signature(combined_state.machine)
+                            previous_signature_output = canonical_signatures_get(
+                                signature
+                            )
+                            is_new_by_signature = (
+                                previous_signature_output is None
+                                or output_length > previous_signature_output
+                            )
+                            if is_new_state:
+                                seen_states[fallback_key] = output_length
+                            if is_new_by_signature:
+                                canonical_signatures[signature] = output_length
+                            if is_target_prefix:
+                                prefix_state = combined_state
+                                found = True
+                                reason = "accepted"
+                            elif not is_new_by_signature:
+                                signature_collisions += 1
+                                reason = "signature_collision"
 
                     _record_trace(
                         suffix,
@@ -268,7 +386,7 @@ class ProgramGenerator:
                         reason=reason,
                         cache_hit=from_cache,
                         depth_level=depth,
-                        target_prefix=target_prefix,
+                        expected_length=expected_length,
                     )
                     if pruned:
                         continue
@@ -278,20 +396,38 @@ class ProgramGenerator:
                 if found:
                     break
 
-                next_frontier: list[str] = []
-                for base in combinations:
-                    for opcode in cfg.opcode_choices:
-                        candidate = base + opcode
-                        candidate_key = prefix_state.opcodes + candidate + "<"
-                        if candidate_key in dead_programs:
-                            continue
-                        next_frontier.append(candidate)
-                combinations = next_frontier
+                # An unfiltered layer expands to the cached template for the next
+                # depth, which is kept as-is when none of its candidates is dead;
+                # other layers are rebuilt from their surviving bases.
+                prefix_opcodes = prefix_state.opcodes
+                layer = self._frontier_template(cfg.opcode_choices, depth)
+                next_layer = (
+                    self._frontier_template(cfg.opcode_choices, depth + 1)
+                    if combinations is layer
+                    else None
+                )
+                if next_layer is not None:
+                    next_frontier = [
+                        candidate
+                        for candidate in next_layer
+                        if prefix_opcodes + candidate + "<" not in dead_programs
+                    ]
+                    if len(next_frontier) == len(next_layer):
+                        combinations = next_layer
+                    else:
+                        combinations = next_frontier
+                else:
+                    combinations = [
+                        base + opcode
+                        for base in combinations
+                        for opcode in base_choices
+                        if prefix_opcodes + base + opcode + "<" not in dead_programs
+                    ]
 
                 if not combinations:
                     raise MalbolgeRuntimeError(
                         "Exhausted opcode search before reaching target prefix "
-                        f"'{target_prefix}'."
+                        f"'{target[:expected_length]}'."
                     )
 
                 if depth >= cfg.max_search_depth and combinations:
@@ -301,12 +437,12 @@ class ProgramGenerator:
                         if (prefix_state.opcodes + candidate + "<") not in dead_programs
                     ]
                     if not viable:
-                        combinations = list(cfg.opcode_choices)
+                        combinations = base_choices
                         depth = 0
                         continue
                     random_choice = rng.choice(viable)
                     random_key = prefix_state.opcodes + random_choice
-                    random_state, random_from_cache = self._get_or_extend_state(
+                    random_state, random_from_cache = get_or_extend_state(
                         prefix_state,
                         random_choice,
                         interpreter,
@@ -320,15 +456,15 @@ class ProgramGenerator:
                         )
                     random_pruned = False
                     random_reason = "random_extension"
-                    random_signature = self._state_signature(random_state.machine)
-                    random_fallback = self._fallback_signature(random_state.machine)
+                    random_signature = state_signature(random_state.machine)
+                    random_fallback = fallback_signature(random_state.machine)
                     random_output_length = len(random_state.output)
-                    random_known_length = seen_states.get(random_fallback)
+                    random_known_length = seen_states_get(random_fallback)
                     random_is_new = (
                         random_known_length is None
                         or random_output_length > random_known_length
                     )
-                    random_previous_signature = canonical_signatures.get(
+                    random_previous_signature = canonical_signatures_get(
                         random_signature
                     )
                     random_is_new_by_signature = (
@@ -364,17 +500,17 @@ class ProgramGenerator:
                         reason=random_reason,
                         cache_hit=random_from_cache,
                         depth_level=depth,
-                        target_prefix=target_prefix,
+                        expected_length=expected_length,
                     )
                     if random_pruned:
-                        combinations = list(cfg.opcode_choices)
+                        combinations = base_choices
                         depth = 0
                         continue
                     prefix_state = random_state
-                    combinations = list(cfg.opcode_choices)
+                    combinations = base_choices
                     depth = 0
 
-        final_state, final_from_cache = self._get_or_extend_state(
+        final_state, final_from_cache = get_or_extend_state(
             prefix_state,
             "v",
             interpreter,
@@ -386,12 +522,12 @@ class ProgramGenerator:
             raise MalbolgeRuntimeError(
                 "Generator requires machine snapshots for heuristics."
             )
-        final_key = self._fallback_signature(final_state.machine)
-        final_signature = self._state_signature(final_state.machine)
+        final_key = fallback_signature(final_state.machine)
+        final_signature = state_signature(final_state.machine)
         final_output_length = len(final_state.output)
         seen_states[final_key] = final_output_length
         canonical_signatures[final_signature] = max(
-            canonical_signatures.get(final_signature, 0),
+            canonical_signatures_get(final_signature, 0),
             final_output_length,
         )
         _record_trace(
@@ -401,7 +537,7 @@ class ProgramGenerator:
             reason="halt",
             cache_hit=final_from_cache,
             depth_level=0,
-            target_prefix=target,
+            expected_length=len(target),
         )
         final_program = final_state.opcodes
         final_output = final_state.output
@@ -436,24 +572,83 @@ class ProgramGenerator:
         suffix: str,
         interpreter: MalbolgeInterpreter,
         cfg: GenerationConfig,
-        cache: dict[str, _PrefixState],
+        cache: OrderedDict[str, _PrefixState],
         stats: _GenerationStats,
+        prefetched: dict[str, _PrefixState] | None = None,
     ) -> tuple[_PrefixState, bool]:
         candidate_key = state.opcodes + suffix
         cached = cache.get(candidate_key)
         if cached is not None:
             stats.cache_hits += 1
+            cache.move_to_end(candidate_key)
             return cached, True
-        extended = self._extend_state(
-            state,
-            suffix,
-            interpreter,
-            cfg,
-            stats,
-        )
+        extended = prefetched.pop(candidate_key, None) if prefetched else None
+        if extended is None:
+            extended = self._extend_state(
+                state,
+                suffix,
+                interpreter,
+                cfg,
+                stats,
+            )
         cache[candidate_key] = extended
+        capacity = cfg.state_cache_capacity
+        if capacity is not None and len(cache) > capacity:
+            # Snapshots only ever extend the newest prefix, so the least
+            # recently used entries are the ones the search has moved past.
+            cache.popitem(last=False)
         return extended, False
 
+    def _prefetch_layer(
+        self,
+        pool: ProcessPoolExecutor,
+        state: _PrefixState,
+        combinations: Sequence[str],
+        cfg: GenerationConfig,
+        cache: OrderedDict[str, _PrefixState],
+        dead_programs: set[str],
+        stats: _GenerationStats,
+    ) -> dict[str, _PrefixState]:
+        """
+        Extend ``state`` with every uncached candidate of a layer in ``pool``.
+
+        Candidates in a layer only depend on the shared prefix snapshot, so they
+        can be executed out of process; the search still consumes the results in
+        order, which keeps parallel runs identical to serial ones.
+        """
+        remaining = cfg.max_program_length - len(state.opcodes)
+        suffixes = [
+            candidate + "<"
+            for candidate in combinations
+            if len(candidate) < remaining
+            and (state.opcodes + candidate + "<") not in dead_programs
+            and (state.opcodes + candidate + "<") not in cache
+        ]
+        if len(suffixes) < 2:
+            return {}
+
+        workers = cfg.parallel_workers or 1
+        chunksize = max(1, len(suffixes) // (workers * 4))
+        prefetched: dict[str, _PrefixState] = {}
+        results = pool.map(
+            partial(_extend_in_worker, state.machine),
+            suffixes,
+            chunksize=chunksize,
+        )
+        for suffix, extension in zip(suffixes, results, strict=True):
+            if extension is None:
+                # Leave failures to the serial path so errors surface exactly
+                # where a serial search would have raised them.
+                continue
+            output, machine = extension
+            stats.evaluations += 1
+            prefetched[state.opcodes + suffix] = _PrefixState(
+                opcodes=state.opcodes + suffix,
+                output=state.output + output,
+                machine=machine,
+            )
+        return prefetched
+
     def _extend_state(
         self,
         state: _PrefixState,
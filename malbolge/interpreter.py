@@ -8,21 +8,89 @@ and avoids unnecessary allocations in tight loops.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Sequence
+import sys
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, MutableSequence, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass, field
-from threading import RLock
+from functools import partial
+from threading import Lock, RLock
 from types import MethodType
 from typing import cast
 
 from .encoding import (
-    ENCRYPTION_TRANSLATE,
+    ENCRYPTION_LUT,
     NORMAL_TRANSLATE,
     VALID_INSTRUCTIONS,
     reverse_normalize,
 )
-from .utils import MAX_ADDRESS_SPACE, crazy_operation, ternary_rotate
+from .utils import (
+    CRAZY_CHUNK,
+    CRAZY_CHUNK_TABLE,
+    MAX_ADDRESS_SPACE,
+    MAX_TERNARY_POWER,
+    crazy_operation,
+    ternary_rotate,
+)
 
 DEFAULT_CYCLE_DETECTION_LIMIT = 100_000
+_VALID_OPCODES = frozenset(VALID_INSTRUCTIONS)
+# Dispatch id of each NORMAL_TRANSLATE slot: its index in VALID_INSTRUCTIONS,
+# or -1 for characters outside the instruction set.
+_OPCODE_IDS = tuple(VALID_INSTRUCTIONS.find(char) for char in NORMAL_TRANSLATE)
+# Cells hold ten-trit words (< 3**10), which fit in an unsigned 16-bit slot.
+TAPE_TYPECODE = "H"
+# Dispatch id for every ``cell + position`` sum a tape can produce: slot ``s``
+# holds the id of NORMAL_TRANSLATE[(s - 33) % 94], so decoding needs neither a
+# modulo nor a string index.
+_DECODE_SPAN = (1 << 16) + MAX_ADDRESS_SPACE
+_DECODE_IDS = (
+    array("b", _OPCODE_IDS[-33 % 94 :] + _OPCODE_IDS[: -33 % 94])
+    * -(-_DECODE_SPAN // 94)
+)[:_DECODE_SPAN]
+
+
+# Tape characters are printable ASCII, so UTF-16 in native byte order encodes
+# each one as a single 16-bit unit that loads straight into the array.
+_TAPE_CODEC = "utf-16-le" if sys.byteorder == "little" else "utf-16-be"
+
+
+# Encoded tapes of recently loaded programs, keyed by their opcode string and
+# shared by every interpreter; the tapes are immutable strings, so a hit never
+# aliases another machine's memory.
+_PROGRAM_CACHE_SIZE = 256
+_program_cache: OrderedDict[str, str] = OrderedDict()
+_program_cache_lock = Lock()
+
+
+def _encode_program(opcodes: str) -> str:
+    """Return the ASCII tape for ``opcodes``, reusing recent encodings."""
+    with _program_cache_lock:
+        ascii_tape = _program_cache.get(opcodes)
+        if ascii_tape is not None:
+            _program_cache.move_to_end(opcodes)
+            return ascii_tape
+    ascii_tape = "".join(reverse_normalize(opcodes))
+    with _program_cache_lock:
+        _program_cache[opcodes] = ascii_tape
+        if len(_program_cache) > _PROGRAM_CACHE_SIZE:
+            _program_cache.popitem(last=False)
+    return ascii_tape
+
+
+def _empty_tape() -> array[int]:
+    return array(TAPE_TYPECODE)
+
+
+def _tape_from_chars(chars: Sequence[str]) -> array[int]:
+    text = chars if isinstance(chars, str) else "".join(chars)
+    cells = array(TAPE_TYPECODE, text.encode(_TAPE_CODEC))
+    if len(cells) != len(chars):
+        # Multi-character items or surrogate pairs; keep ord()'s errors.
+        cells = array(TAPE_TYPECODE, map(ord, chars))
+    return cells
 
 
 class MalbolgeRuntimeError(RuntimeError):
@@ -45,9 +113,22 @@ class MemoryLimitExceededError(MalbolgeRuntimeError):
     """Raised when the interpreter would access memory beyond the allowed limit."""
 
 
+def _next_input_code(input_iter: Iterator[str] | None) -> int:
+    """Read the next lazily supplied input item; empty items yield -1."""
+    if input_iter is None:
+        raise InputUnderflowError("Input instruction encountered with empty buffer.")
+    try:
+        item = next(input_iter)
+    except StopIteration as exc:
+        raise InputUnderflowError(
+            "Input instruction encountered with empty buffer."
+        ) from exc
+    return ord(item[0]) if item else -1
+
+
 @dataclass(slots=True)
 class MalbolgeMachine:
-    tape: list[int] = field(default_factory=list)
+    tape: MutableSequence[int] = field(default_factory=_empty_tape)
     a: int = 0
     c: int = 0
     d: int = 0
@@ -56,22 +137,10 @@ class MalbolgeMachine:
         default=None, init=False, repr=False, compare=False
     )
 
-    def __setattr__(self, name: str, value: object) -> None:
-        if name == "encrypt_current_cell":
-            if value is None:
-                object.__setattr__(self, "_encrypt_override", None)
-                return
-            if isinstance(value, MethodType):
-                override_callable = value.__func__
-            else:
-                if not callable(value):
-                    raise TypeError(
-                        "encrypt_current_cell override must be callable or None."
-                    )
-                override_callable = cast(Callable[[MalbolgeMachine], None], value)
-            object.__setattr__(self, "_encrypt_override", override_callable)
-            return
-        object.__setattr__(self, name, value)
+    def __post_init__(self) -> None:
+        if not isinstance(self.tape, array):
+            # Store cells packed rather than as a list of boxed ints.
+            self.tape = array(TAPE_TYPECODE, self.tape)
 
     def reset(self) -> None:
         self.a = 0
@@ -81,24 +150,46 @@ class MalbolgeMachine:
         self._encrypt_override = None
 
     def load_tape(self, ascii_tape: Sequence[str]) -> None:
-        self.tape = [ord(ch) for ch in ascii_tape]
+        self.tape = _tape_from_chars(ascii_tape)
         if len(self.tape) > MAX_ADDRESS_SPACE:
             raise MalbolgeRuntimeError("Program exceeds maximum addressable tape size.")
         self.reset()
 
     def copy(self) -> MalbolgeMachine:
-        clone = MalbolgeMachine(self.tape.copy(), self.a, self.c, self.d, self.halted)
-        if self._encrypt_override is not None:
-            object.__setattr__(clone, "_encrypt_override", self._encrypt_override)
+        clone = MalbolgeMachine(self.tape[:], self.a, self.c, self.d, self.halted)
+        clone._encrypt_override = self._encrypt_override
         return clone
 
-    def encrypt_current_cell(self) -> None:
-        if self._encrypt_override is not None:
-            self._encrypt_override(self)
+    # Overrides are routed through a property rather than a custom __setattr__
+    # so that register writes keep using the plain slot descriptors.
+    @property
+    def encrypt_current_cell(self) -> Callable[[], None]:
+        override = self._encrypt_override
+        if override is not None:
+            return MethodType(override, self)
+        return self._encrypt_default
+
+    @encrypt_current_cell.setter
+    def encrypt_current_cell(self, value: Callable[..., None] | None) -> None:
+        if value is None:
+            self._encrypt_override = None
             return
+        if isinstance(value, MethodType):
+            override_callable = value.__func__
+        else:
+            if not callable(value):
+                raise TypeError(
+                    "encrypt_current_cell override must be callable or None."
+                )
+            override_callable = value
+        self._encrypt_override = cast(
+            Callable[[MalbolgeMachine], None], override_callable
+        )
+
+    def _encrypt_default(self) -> None:
         cell_value = self.tape[self.c]
-        if 33 <= cell_value <= 126:
-            self.tape[self.c] = ord(ENCRYPTION_TRANSLATE[cell_value - 33])
+        if cell_value < 256:
+            self.tape[self.c] = ENCRYPTION_LUT[cell_value]
 
 
 @dataclass(slots=True)
@@ -127,6 +218,8 @@ class MalbolgeInterpreter:
     Execute normalized Malbolge opcodes and capture output.
 
     A single interpreter instance can run multiple programs sequentially.
+    Execution is serialized by a re-entrant lock; pass ``thread_safe=False``
+    to skip locking when an instance is only ever driven from one thread.
     """
 
     def __init__(
@@ -135,6 +228,7 @@ class MalbolgeInterpreter:
         allow_memory_expansion: bool = True,
         memory_limit: int | None = MAX_ADDRESS_SPACE,
         cycle_detection_limit: int | None = DEFAULT_CYCLE_DETECTION_LIMIT,
+        thread_safe: bool = True,
     ) -> None:
         self.machine = MalbolgeMachine()
         self._allow_memory_expansion = allow_memory_expansion
@@ -145,7 +239,9 @@ class MalbolgeInterpreter:
         self._cycle_detection_limit = cycle_detection_limit
         self._memory_expansions = 0
         self._peak_tape_length = 0
-        self._lock = RLock()
+        self._lock: AbstractContextManager[object] = (
+            RLock() if thread_safe else nullcontext()
+        )
 
     def load_program(self, opcodes: Sequence[str]) -> None:
         with self._lock:
@@ -154,10 +250,14 @@ class MalbolgeInterpreter:
     def _load_program_unlocked(self, opcodes: Sequence[str]) -> None:
         if len(opcodes) == 0:
             raise InvalidOpcodeError("Opcode sequence is empty.")
-        if any(opcode not in VALID_INSTRUCTIONS for opcode in opcodes):
+        if not _VALID_OPCODES.issuperset(opcodes):
             raise InvalidOpcodeError("Encountered invalid opcode during load.")
 
-        ascii_tape = reverse_normalize(opcodes)
+        ascii_tape: Sequence[str]
+        if isinstance(opcodes, str):
+            ascii_tape = _encode_program(opcodes)
+        else:
+            ascii_tape = reverse_normalize(opcodes)
         self.machine.load_tape(ascii_tape)
         self._program_length = len(opcodes)
         self._reset_diagnostics()
@@ -197,6 +297,60 @@ class MalbolgeInterpreter:
         )
         return result.output
 
+    def execute_batch(
+        self,
+        programs: Iterable[Sequence[str]],
+        *,
+        input_buffer: Iterable[str] | None = None,
+        max_steps: int | None = None,
+        parallel_workers: int | None = None,
+    ) -> list[ExecutionResult]:
+        """
+        Execute each program from a fresh tape and return the results in order.
+
+        Every program receives the same ``input_buffer`` and ``max_steps``; the
+        buffer is read into memory once up front, so it must be finite.
+        Serial batches hold the lock once for the whole batch; with
+        ``parallel_workers`` above one the programs are spread across worker
+        processes configured like this interpreter, whose own machine is then
+        left untouched. Errors propagate as they would from :meth:`execute`.
+        """
+        if parallel_workers is not None and parallel_workers < 1:
+            raise ValueError("parallel_workers must be positive or None.")
+        programs = list(programs)
+        inputs = tuple(input_buffer) if input_buffer is not None else None
+        if parallel_workers is None or parallel_workers == 1 or len(programs) < 2:
+            with self._lock:
+                results = []
+                for opcodes in programs:
+                    self._load_program_unlocked(opcodes)
+                    results.append(
+                        self._execute_loaded(
+                            input_buffer=inputs,
+                            max_steps=max_steps,
+                            capture_machine=False,
+                        )
+                    )
+                return results
+
+        chunksize = max(1, len(programs) // (parallel_workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=parallel_workers,
+            initializer=_init_batch_worker,
+            initargs=(
+                self._allow_memory_expansion,
+                self._memory_limit,
+                self._cycle_detection_limit,
+            ),
+        ) as pool:
+            return list(
+                pool.map(
+                    partial(_execute_in_worker, inputs, max_steps),
+                    programs,
+                    chunksize=chunksize,
+                )
+            )
+
     def resume(
         self,
         *,
@@ -241,7 +395,7 @@ class MalbolgeInterpreter:
                 ascii_suffix = reverse_normalize(
                     suffix_opcodes, start_index=prefix_length
                 )
-                machine.tape.extend(ord(ch) for ch in ascii_suffix)
+                machine.tape.extend(_tape_from_chars(ascii_suffix))
             self.machine = machine
             self._program_length = prefix_length + len(suffix_opcodes)
             self._reset_diagnostics()
@@ -260,16 +414,347 @@ class MalbolgeInterpreter:
     ) -> ExecutionResult:
         machine = self.machine
         machine.halted = False
-        output_chars: list[str] = []
-        input_iter = iter(input_buffer or [])
+        # Output bytes are decoded once at the end: latin-1 maps each byte to
+        # the same code point chr() would give it.
+        output_bytes = bytearray()
+        # Each buffered item supplies the code point of its first character;
+        # empty items are kept as -1 so the error surfaces when they are read.
+        # Sequences (including str) are converted up front; any other iterable
+        # may be lazy or endless, so it is read one item per input instruction.
+        input_codes: Sequence[int] = ()
+        input_iter: Iterator[str] | None = None
+        if isinstance(input_buffer, Sequence):
+            input_codes = tuple(ord(item[0]) if item else -1 for item in input_buffer)
+        elif input_buffer is not None:
+            input_iter = iter(input_buffer)
+        metadata = HaltMetadata()
+
+        if self._uses_default_hooks(machine):
+            run = self._run_core
+        else:
+            run = self._run_hooked
+        halt_reason, steps_executed, tracking_limited = run(
+            machine, output_bytes, input_codes, input_iter, max_steps, metadata
+        )
 
+        if halt_reason is None:
+            halt_reason = "unknown"
+        metadata.cycle_tracking_limited = tracking_limited
+        snapshot = machine.copy() if capture_machine else None
+        return ExecutionResult(
+            output=output_bytes.decode("latin-1"),
+            halted=machine.halted,
+            steps=steps_executed,
+            halt_reason=halt_reason,
+            machine=snapshot,
+            halt_metadata=metadata,
+            memory_expansions=self._memory_expansions,
+            peak_memory_cells=self._peak_tape_length,
+        )
+
+    def _uses_default_hooks(self, machine: MalbolgeMachine) -> bool:
+        """Return whether neither decoding nor encryption has been overridden."""
+        return (
+            "_instruction_at" not in vars(self)
+            and type(self)._instruction_at is _DEFAULT_INSTRUCTION_AT
+            and machine._encrypt_override is None
+            and type(machine).encrypt_current_cell is _DEFAULT_ENCRYPT_CURRENT_CELL
+        )
+
+    def _run_core(
+        self,
+        machine: MalbolgeMachine,
+        output_bytes: bytearray,
+        input_codes: Sequence[int],
+        input_iter: Iterator[str] | None,
+        max_steps: int | None,
+        metadata: HaltMetadata,
+    ) -> tuple[str | None, int, bool]:
+        """
+        Run the dispatch loop with the registers held in locals.
+
+        Decoding and encryption are inlined, so this path is only taken while
+        the default hooks are installed; registers are written back to the
+        machine on exit, including when an error interrupts execution.
+        """
+        tape = machine.tape
+        # Only ensure_capacity grows the tape, so its length is refreshed there.
+        tape_len = len(tape)
+        a = machine.a
+        c = machine.c
+        d = machine.d
+        halted = False
+        program_length = self._program_length
+        cycle_limit = self._cycle_detection_limit
+        ensure_capacity = self._ensure_capacity
+        append_output = output_bytes.append
+        input_length = len(input_codes)
+        input_cursor = 0
+        decode_ids = _DECODE_IDS
+        crazy_table = CRAZY_CHUNK_TABLE
+        chunk = CRAZY_CHUNK
+        # Brent's cycle detection: compare each state against a snapshot taken
+        # at the start of a window that doubles up to cycle_limit steps.
+        tortoise_c = tortoise_cell = tortoise_a = tortoise_d = -1
+        tortoise_step = 0
+        next_snapshot = 0
+        window = 1
+        # Unlimited runs get an unreachable budget so the loop tests a single
+        # comparison per step instead of branching on max_steps.
+        step_limit = max_steps if max_steps is not None else sys.maxsize
+        steps_executed = 0
+        tracking_limited = False
+        halt_reason: str | None = None
+        fetched: int | None = None
+        last_jump_target: int | None = None
+
+        try:
+            while not halted:
+                if steps_executed >= step_limit:
+                    raise StepLimitExceededError("Maximum step count exceeded.")
+                if c >= program_length:
+                    halted = True
+                    halt_reason = "program_end"
+                    break
+
+                if c >= tape_len:
+                    ensure_capacity(c)
+                    tape_len = len(tape)
+                cell_value = tape[c]
+                if cycle_limit is not None:
+                    if (
+                        c == tortoise_c
+                        and a == tortoise_a
+                        and d == tortoise_d
+                        and cell_value == tortoise_cell
+                    ):
+                        metadata.cycle_repeat_length = steps_executed - tortoise_step
+                        metadata.cycle_detected = True
+                        # The first repeat settles the diagnostics; stop tracking.
+                        cycle_limit = None
+                    elif steps_executed >= next_snapshot:
+                        if window > cycle_limit:
+                            tracking_limited = True
+                            window = cycle_limit
+                        if window:
+                            tortoise_c, tortoise_cell = c, cell_value
+                            tortoise_a, tortoise_d = a, d
+                            tortoise_step = steps_executed
+                            next_snapshot = steps_executed + window
+                            window *= 2
+                fetched = cell_value + c
+                opcode_id = decode_ids[fetched]
+
+                # Ids follow VALID_INSTRUCTIONS ("i</*jpov"); cases are ordered
+                # by how often generated programs hit them.
+                match opcode_id:
+                    case 6:  # o: NOP / placeholder used by generator to advance D.
+                        # Retire the rest of a NOP run here instead of going
+                        # round the full loop per cell. The run stops short of
+                        # anything the loop header must handle: the step
+                        # budget, program end, unallocated cells and, while
+                        # tracking cycles, the next snapshot and the
+                        # tortoise's cell.
+                        run_end = min(
+                            program_length, tape_len, c + step_limit - steps_executed
+                        )
+                        if cycle_limit is not None:
+                            run_end = min(run_end, c + next_snapshot - steps_executed)
+                            if tortoise_c > c:
+                                run_end = min(run_end, tortoise_c)
+                        run_start = c
+                        following = c + 1
+                        while following < run_end:
+                            next_value = tape[following]
+                            if decode_ids[next_value + following] != 6:
+                                break
+                            if cell_value < 256:
+                                tape[c] = ENCRYPTION_LUT[cell_value]
+                            c = following
+                            cell_value = next_value
+                            following += 1
+                        d += c - run_start
+                        steps_executed += c - run_start
+                    case 5:  # p
+                        if d >= tape_len:
+                            ensure_capacity(d)
+                            tape_len = len(tape)
+                        # crazy_operation and ternary_rotate, inlined.
+                        value = tape[d]
+                        a = (
+                            crazy_table[(a % chunk) * chunk + value % chunk]
+                            + crazy_table[
+                                (a // chunk % chunk) * chunk + value // chunk % chunk
+                            ]
+                            * chunk
+                        )
+                        tape[d] = a
+                        if d == c:
+                            cell_value = a
+                    case 1:  # <
+                        append_output(a % 256)
+                    case 3:  # *
+                        if d >= tape_len:
+                            ensure_capacity(d)
+                            tape_len = len(tape)
+                        value = tape[d]
+                        a = value // 3 + value % 3 * MAX_TERNARY_POWER
+                        tape[d] = a
+                        if d == c:
+                            cell_value = a
+                    case 0:  # i
+                        if d >= tape_len:
+                            ensure_capacity(d)
+                            tape_len = len(tape)
+                        jump_target = tape[d]
+                        c = jump_target
+                        if c >= tape_len:
+                            ensure_capacity(c)
+                            tape_len = len(tape)
+                        cell_value = tape[c]
+                        last_jump_target = jump_target
+                    case 4:  # j
+                        if d >= tape_len:
+                            ensure_capacity(d)
+                            tape_len = len(tape)
+                        jump_target = tape[d]
+                        d = jump_target
+                        if d >= tape_len:
+                            ensure_capacity(d)
+                            tape_len = len(tape)
+                        last_jump_target = jump_target
+                    case 2:  # /
+                        if input_cursor < input_length:
+                            next_code = input_codes[input_cursor]
+                            input_cursor += 1
+                        else:
+                            next_code = _next_input_code(input_iter)
+                        if next_code < 0:
+                            raise InputUnderflowError(
+                                "Input buffer supplied an empty string."
+                            )
+                        a = next_code
+                    case 7:  # v
+                        halted = True
+                        halt_reason = "halt_opcode"
+                    case _:
+                        raise MalbolgeRuntimeError(
+                            "Unsupported opcode "
+                            f"'{NORMAL_TRANSLATE[(fetched - 33) % 94]}'."
+                        )
+
+                # cell_value tracks tape[c] through the instruction above, so
+                # encryption reuses the fetch instead of reading the cell again.
+                if cell_value < 256:
+                    tape[c] = ENCRYPTION_LUT[cell_value]
+
+                c += 1
+                d += 1
+                steps_executed += 1
+        finally:
+            machine.a = a
+            machine.c = c
+            machine.d = d
+            machine.halted = halted
+            if fetched is not None:
+                metadata.last_instruction = NORMAL_TRANSLATE[(fetched - 33) % 94]
+            metadata.last_jump_target = last_jump_target
+
+        return halt_reason, steps_executed, tracking_limited
+
+    def _run_hooked(
+        self,
+        machine: MalbolgeMachine,
+        output_bytes: bytearray,
+        input_codes: Sequence[int],
+        input_iter: Iterator[str] | None,
+        max_steps: int | None,
+        metadata: HaltMetadata,
+    ) -> tuple[str | None, int, bool]:
+        """Run the dispatch loop through the overridable machine hooks."""
+        input_cursor = 0
         steps_remaining = max_steps
         steps_executed = 0
         halt_reason: str | None = None
-        metadata = HaltMetadata()
-        seen_states: dict[tuple[int, int, int, int], int] = {}
+        tortoise: tuple[int, int, int, int] | None = None
+        tortoise_step = 0
+        next_snapshot = 0
+        window = 1
         tracking_limited = False
         cycle_limit = self._cycle_detection_limit
+        instruction: str | None = None
+        last_jump_target: int | None = None
+        ensure_capacity = self._ensure_capacity
+
+        # Instructions come from the overridable _instruction_at as strings, so
+        # they are dispatched through a table of closures; jumps return their
+        # target for the halt metadata.
+        def jump_code() -> int | None:
+            if machine.d >= len(machine.tape):
+                ensure_capacity(machine.d)
+            jump_target = machine.tape[machine.d]
+            machine.c = jump_target
+            if machine.c >= len(machine.tape):
+                ensure_capacity(machine.c)
+            return jump_target
+
+        def write_output() -> int | None:
+            output_bytes.append(machine.a % 256)
+            return None
+
+        def read_input() -> int | None:
+            nonlocal input_cursor
+            if input_cursor < len(input_codes):
+                next_code = input_codes[input_cursor]
+                input_cursor += 1
+            else:
+                next_code = _next_input_code(input_iter)
+            if next_code < 0:
+                raise InputUnderflowError("Input buffer supplied an empty string.")
+            machine.a = next_code
+            return None
+
+        def rotate() -> int | None:
+            if machine.d >= len(machine.tape):
+                ensure_capacity(machine.d)
+            machine.a = ternary_rotate(machine.tape[machine.d])
+            machine.tape[machine.d] = machine.a
+            return None
+
+        def jump_data() -> int | None:
+            if machine.d >= len(machine.tape):
+                ensure_capacity(machine.d)
+            jump_target = machine.tape[machine.d]
+            machine.d = jump_target
+            if machine.d >= len(machine.tape):
+                ensure_capacity(machine.d)
+            return jump_target
+
+        def crazy() -> int | None:
+            if machine.d >= len(machine.tape):
+                ensure_capacity(machine.d)
+            machine.a = crazy_operation(machine.a, machine.tape[machine.d])
+            machine.tape[machine.d] = machine.a
+            return None
+
+        def nop() -> int | None:
+            # NOP / placeholder used by generator to advance D.
+            return None
+
+        def halt() -> int | None:
+            machine.halted = True
+            return None
+
+        handlers: dict[str, Callable[[], int | None]] = {
+            "i": jump_code,
+            "<": write_output,
+            "/": read_input,
+            "*": rotate,
+            "j": jump_data,
+            "p": crazy,
+            "o": nop,
+            "v": halt,
+        }
 
         while not machine.halted:
             if steps_remaining is not None:
@@ -281,62 +766,35 @@ class MalbolgeInterpreter:
                 halt_reason = "program_end"
                 break
 
-            self._ensure_capacity(machine.c)
+            if machine.c >= len(machine.tape):
+                self._ensure_capacity(machine.c)
             cell_value = machine.tape[machine.c]
             if cycle_limit is not None:
                 state_key = (machine.c, cell_value, machine.a, machine.d)
-                first_seen = seen_states.get(state_key)
-                if first_seen is not None:
-                    if metadata.cycle_repeat_length is None:
-                        metadata.cycle_repeat_length = steps_executed - first_seen
+                if state_key == tortoise:
+                    metadata.cycle_repeat_length = steps_executed - tortoise_step
                     metadata.cycle_detected = True
-                elif len(seen_states) < cycle_limit:
-                    seen_states[state_key] = steps_executed
-                else:
-                    tracking_limited = True
+                    # The first repeat settles the diagnostics; stop tracking.
+                    cycle_limit = None
+                elif steps_executed >= next_snapshot:
+                    if window > cycle_limit:
+                        tracking_limited = True
+                        window = cycle_limit
+                    if window:
+                        tortoise = state_key
+                        tortoise_step = steps_executed
+                        next_snapshot = steps_executed + window
+                        window *= 2
             instruction = self._instruction_at(machine.c)
-            metadata.last_instruction = instruction
 
-            if instruction == "i":
-                self._ensure_capacity(machine.d)
-                jump_target = machine.tape[machine.d]
-                machine.c = jump_target
-                self._ensure_capacity(machine.c)
-                metadata.last_jump_target = jump_target
-            elif instruction == "<":
-                output_chars.append(chr(machine.a % 256))
-            elif instruction == "/":
-                try:
-                    next_input = next(input_iter)
-                except StopIteration as exc:
-                    raise InputUnderflowError(
-                        "Input instruction encountered with empty buffer."
-                    ) from exc
-                if not next_input:
-                    raise InputUnderflowError("Input buffer supplied an empty string.")
-                machine.a = ord(next_input[0])
-            elif instruction == "*":
-                self._ensure_capacity(machine.d)
-                machine.a = ternary_rotate(machine.tape[machine.d])
-                machine.tape[machine.d] = machine.a
-            elif instruction == "j":
-                self._ensure_capacity(machine.d)
-                jump_target = machine.tape[machine.d]
-                machine.d = jump_target
-                self._ensure_capacity(machine.d)
-                metadata.last_jump_target = jump_target
-            elif instruction == "p":
-                self._ensure_capacity(machine.d)
-                machine.a = crazy_operation(machine.a, machine.tape[machine.d])
-                machine.tape[machine.d] = machine.a
-            elif instruction == "o":
-                # NOP / placeholder used by generator to advance D.
-                pass
-            elif instruction == "v":
-                machine.halted = True
-                halt_reason = "halt_opcode"
-            else:
+            handler = handlers.get(instruction)
+            if handler is None:
                 raise MalbolgeRuntimeError(f"Unsupported opcode '{instruction}'.")
+            jump_target = handler()
+            if jump_target is not None:
+                last_jump_target = jump_target
+            if machine.halted:
+                halt_reason = "halt_opcode"
 
             machine.encrypt_current_cell()
 
@@ -344,20 +802,10 @@ class MalbolgeInterpreter:
             machine.d += 1
             steps_executed += 1
 
-        if halt_reason is None:
-            halt_reason = "unknown"
-        metadata.cycle_tracking_limited = tracking_limited
-        snapshot = machine.copy() if capture_machine else None
-        return ExecutionResult(
-            output="".join(output_chars),
-            halted=machine.halted,
-            steps=steps_executed,
-            halt_reason=halt_reason,
-            machine=snapshot,
-            halt_metadata=metadata,
-            memory_expansions=self._memory_expansions,
-            peak_memory_cells=self._peak_tape_length,
-        )
+        # Only the final values are reported, so they are stored once.
+        metadata.last_instruction = instruction
+        metadata.last_jump_target = last_jump_target
+        return halt_reason, steps_executed, tracking_limited
 
     def _ensure_capacity(self, index: int) -> None:
         machine = self.machine
@@ -374,28 +822,71 @@ class MalbolgeInterpreter:
             raise MemoryLimitExceededError("Memory limit exceeded.")
 
         limit = min(self._memory_limit, MAX_ADDRESS_SPACE)
-        while len(machine.tape) <= index:
-            if len(machine.tape) >= 2:
-                next_value = crazy_operation(machine.tape[-2], machine.tape[-1])
-            elif len(machine.tape) == 1:
-                next_value = crazy_operation(machine.tape[0], machine.tape[0])
-            else:
-                next_value = 0
-
-            machine.tape.append(next_value)
-            if len(machine.tape) >= limit:
-                break
+        tape = machine.tape
+        # Grow to the requested index in one extend; the loop always adds at
+        # least one cell but stops at the address-space limit.
+        target_length = max(min(index + 1, limit), initial_length + 1)
+        grown: list[int] = []
+        if initial_length >= 2:
+            previous, last = tape[-2], tape[-1]
+        elif initial_length == 1:
+            previous = last = tape[0]
+        else:
+            grown.append(0)
+            previous = last = 0
+        # crazy_operation(previous, last), inlined as two half-word lookups.
+        table = CRAZY_CHUNK_TABLE
+        chunk = CRAZY_CHUNK
+        for _ in range(target_length - initial_length - len(grown)):
+            next_value = (
+                table[(previous % chunk) * chunk + last % chunk]
+                + table[(previous // chunk % chunk) * chunk + last // chunk % chunk]
+                * chunk
+            )
+            grown.append(next_value)
+            previous, last = last, next_value
+        tape.extend(grown)
 
-        if index >= len(machine.tape):
+        new_length = len(tape)
+        if index >= new_length:
             raise MemoryLimitExceededError(
                 "Unable to expand memory to requested index."
             )
-        appended = len(machine.tape) - initial_length
-        if appended > 0:
-            self._memory_expansions += appended
-            if len(machine.tape) > self._peak_tape_length:
-                self._peak_tape_length = len(machine.tape)
+        self._memory_expansions += new_length - initial_length
+        if new_length > self._peak_tape_length:
+            self._peak_tape_length = new_length
 
     def _instruction_at(self, index: int) -> str:
         value = self.machine.tape[index]
         return NORMAL_TRANSLATE[(value - 33 + index) % 94]
+
+
+# Interpreter owned by each execute_batch worker process.
+_BATCH_WORKER: MalbolgeInterpreter | None = None
+
+
+def _init_batch_worker(
+    allow_memory_expansion: bool,
+    memory_limit: int,
+    cycle_detection_limit: int | None,
+) -> None:
+    global _BATCH_WORKER
+    _BATCH_WORKER = MalbolgeInterpreter(
+        allow_memory_expansion=allow_memory_expansion,
+        memory_limit=memory_limit,
+        cycle_detection_limit=cycle_detection_limit,
+        thread_safe=False,
+    )
+
+
+def _execute_in_worker(
+    input_buffer: tuple[str, ...] | None,
+    max_steps: int | None,
+    opcodes: Sequence[str],
+) -> ExecutionResult:
+    interpreter = _BATCH_WORKER or MalbolgeInterpreter()
+    return interpreter.execute(opcodes, input_buffer=input_buffer, max_steps=max_steps)
+
+
+_DEFAULT_INSTRUCTION_AT = MalbolgeInterpreter._instruction_at
+_DEFAULT_ENCRYPT_CURRENT_CELL = MalbolgeMachine.encrypt_current_cell
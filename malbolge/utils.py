@@ -17,6 +17,21 @@ def convert_to_base3(value: int, digits: int = TERNARY_DIGITS) -> list[int]:
     if value < 0:
         raise ValueError("Malbolge numbers must be non-negative.")
 
+    if digits == TERNARY_DIGITS:
+        # Unrolled for the machine word; higher trits are dropped as below.
+        return [
+            value % 3,
+            value // 3 % 3,
+            value // 9 % 3,
+            value // 27 % 3,
+            value // 81 % 3,
+            value // 243 % 3,
+            value // 729 % 3,
+            value // 2187 % 3,
+            value // 6561 % 3,
+            value // 19683 % 3,
+        ]
+
     result: list[int] = [0] * digits
     current = value
     idx = 0
@@ -30,6 +45,21 @@ def convert_to_base3(value: int, digits: int = TERNARY_DIGITS) -> list[int]:
 
 def convert_to_base10(values: Sequence[int]) -> int:
     """Convert a sequence of ternary digits (LSB first) back to base 10."""
+    if len(values) == TERNARY_DIGITS:
+        d0, d1, d2, d3, d4, d5, d6, d7, d8, d9 = values
+        return (
+            d0
+            + d1 * 3
+            + d2 * 9
+            + d3 * 27
+            + d4 * 81
+            + d5 * 243
+            + d6 * 729
+            + d7 * 2187
+            + d8 * 6561
+            + d9 * 19683
+        )
+
     total = 0
     for index, digit in enumerate(values):
         total += digit * POWERS_OF_THREE[index]
@@ -42,19 +72,41 @@ def ternary_rotate(value: int) -> int:
     return (value // 3) + (least_significant * MAX_TERNARY_POWER)
 
 
+def _build_crazy_table(digits: int) -> tuple[int, ...]:
+    """Tabulate the crazy operation over every pair of ``digits``-trit values."""
+    table = [0]
+    size = 1
+    for _ in range(digits):
+        # Extend each operand by a new least significant trit: entry (f, s)
+        # combines the truth table for (f % 3, s % 3) with entry (f // 3, s // 3).
+        next_size = size * 3
+        extended: list[int] = []
+        for first in range(next_size):
+            high = table[(first // 3) * size : (first // 3 + 1) * size]
+            row = [0] * next_size
+            for low_second in range(3):
+                low = _CRAZY_TABLE[(first % 3) * 3 + low_second]
+                row[low_second::3] = [low + 3 * value for value in high]
+            extended.extend(row)
+        table = extended
+        size = next_size
+    return tuple(table)
+
+
+# Results of the crazy operation on every pair of five-trit halves, indexed by
+# ``first * CRAZY_CHUNK + second``; a ten-trit word is two such lookups.
+CRAZY_CHUNK: int = POWERS_OF_THREE[TERNARY_DIGITS // 2]
+CRAZY_CHUNK_TABLE: tuple[int, ...] = _build_crazy_table(TERNARY_DIGITS // 2)
+
+
 def crazy_operation(first: int, second: int) -> int:
     """
     Execute the Malbolge 'crazy' operation on two values.
 
-    The transformation is defined digit-wise using Malbolge's custom truth table.
+    The transformation is defined digit-wise using Malbolge's custom truth table;
+    it is evaluated a half-word at a time through ``CRAZY_CHUNK_TABLE``.
     """
-    total = 0
-    power = 1
-    local_first = first
-    local_second = second
-    for _ in range(TERNARY_DIGITS):
-        total += _CRAZY_TABLE[(local_first % 3) * 3 + (local_second % 3)] * power
-        local_first //= 3
-        local_second //= 3
-        power *= 3
-    return total
+    chunk = CRAZY_CHUNK
+    low = CRAZY_CHUNK_TABLE[(first % chunk) * chunk + second % chunk]
+    high = CRAZY_CHUNK_TABLE[(first // chunk % chunk) * chunk + second // chunk % chunk]
+    return low + high * chunk
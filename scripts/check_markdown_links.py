@@ -17,24 +17,33 @@ from collections.abc import Iterable
 from pathlib import Path
 
 # The patterns target inline links ([text](url)) and reference links ([text][label]).
+# They are scanned separately because matches of the two can overlap, as in
+# ``[a][b](url)``.
 INLINE_LINK_RE = re.compile(
     r"(?<!\!)\[(?P<text>[^\]]+)\]\(\s*(?P<url>[^)\s]+)(?:\s+\"[^\"]*\")?\s*\)"
 )
 REFERENCE_LINK_RE = re.compile(r"(?<!\!)\[(?P<text>[^\]]+)\]\[(?P<label>[^\]]*)\]")
+ALPHA_RE = re.compile(r"[A-Za-z]")
 
 # Terms that should not be used as link text because they fail to describe the target.
 PROHIBITED_TEXT = {"click here", "here", "link", "this link"}
 
 
 def collect_markdown_files(paths: Iterable[str]) -> list[Path]:
-    files: set[Path] = set()
-    for entry in paths:
+    entries = list(paths)
+    files: list[Path] = []
+    for entry in entries:
         path = Path(entry)
         if path.is_dir():
-            files.update(path.rglob("*.md"))
+            files.extend(path.rglob("*.md"))
         elif path.suffix.lower() == ".md":
-            files.add(path)
-    return sorted(files)
+            files.append(path)
+    # A single rglob never repeats a path; only overlapping arguments need
+    # deduplicating.
+    if len(entries) > 1:
+        files = list(dict.fromkeys(files))
+    files.sort()
+    return files
 
 
 def iter_relevant_lines(path: Path) -> Iterable[tuple[int, str]]:
@@ -73,14 +82,12 @@ def is_human_readable(text: str, url: str | None = None) -> bool:
     if url and candidate.lower().strip("<>") == url.lower().strip("<>"):
         return False
 
-    if normalized.startswith("http://") or normalized.startswith("https://"):
-        return False
-
-    if re.fullmatch(r"https?://\S+", candidate):
+    # Also covers bare URLs, which always start with the scheme.
+    if normalized.startswith(("http://", "https://")):
         return False
 
     # Require at least one alphabetic character to encourage descriptive text.
-    if not re.search(r"[A-Za-z]", candidate):
+    if not ALPHA_RE.search(candidate):
         return False
 
     return True
@@ -67,56 +67,53 @@ def prepare_staging(clean: bool) -> None:
         shutil.rmtree(DEFAULT_SITE_DIR)
 
     copy_markdown_sources(DEFAULT_STAGING_DIR)
-    rewrite_readme_links(DEFAULT_STAGING_DIR)
-    rewrite_directory_links(DEFAULT_STAGING_DIR)
+    rewrite_links(DEFAULT_STAGING_DIR)
 
 
-def rewrite_readme_links(staging_dir: Path) -> None:
+# Directory-style links that MkDocs needs pointed at an explicit file.
+DIRECTORY_LINK_REPLACEMENTS = {
+    "(../examples/samples)": "(../examples/samples/README.md)",
+    "(../examples/samples/)": "(../examples/samples/README.md)",
+    "(./samples)": "(samples/README.md)",
+    "(./samples/)": "(samples/README.md)",
+}
+DIRECTORY_LINK_RE = re.compile(
+    "|".join(re.escape(old) for old in DIRECTORY_LINK_REPLACEMENTS)
+)
+README_LINK_RE = re.compile(r"\((?:\.{1,2}/)*README\.md(#[^)]+)?\)")
+
+
+def rewrite_links(staging_dir: Path) -> None:
     """
-    Adjust README links in staged files to point at the MkDocs homepage.
+    Rewrite links in staged files so they resolve inside the MkDocs site.
 
-    Any relative link to README.md is rewritten to the correct relative path
-    to index.md within the staging tree to avoid duplicate homepage content.
+    Relative links to README.md are pointed at the relative path to index.md,
+    avoiding duplicate homepage content, and directory-style links to folders
+    containing README files are normalized to explicit file targets. Each file
+    is read once and only written back when a link changed.
     """
     index_path = staging_dir / "index.md"
-    if not index_path.exists():
-        return
+    rewrite_readme = index_path.exists()
 
-    pattern = re.compile(r"\((?:\.{1,2}/)*README\.md(#[^)]+)?\)")
+    def replace_directory(match: re.Match) -> str:
+        return DIRECTORY_LINK_REPLACEMENTS[match.group(0)]
 
     for md_file in staging_dir.rglob("*.md"):
         text = md_file.read_text(encoding="utf-8")
+        updated = text
 
-        relative_index = Path(os.path.relpath(index_path, md_file.parent)).as_posix()
-
-        def replace(match: re.Match, index: str = relative_index) -> str:
-            anchor = match.group(1) or ""
-            return f"({index}{anchor})"
-
-        updated = pattern.sub(replace, text)
-        if updated != text:
-            md_file.write_text(updated, encoding="utf-8")
-
+        if rewrite_readme:
+            relative_index = Path(
+                os.path.relpath(index_path, md_file.parent)
+            ).as_posix()
 
-def rewrite_directory_links(staging_dir: Path) -> None:
-    """
-    Normalize directory-style links to explicit files where needed.
+            def replace_readme(match: re.Match, index: str = relative_index) -> str:
+                anchor = match.group(1) or ""
+                return f"({index}{anchor})"
 
-    Some docs reference folders that contain README files; MkDocs expects a
-    direct file target. This keeps those links valid without altering sources.
-    """
-    replacements = {
-        "(../examples/samples)": "(../examples/samples/README.md)",
-        "(../examples/samples/)": "(../examples/samples/README.md)",
-        "(./samples)": "(samples/README.md)",
-        "(./samples/)": "(samples/README.md)",
-    }
+            updated = README_LINK_RE.sub(replace_readme, updated)
 
-    for md_file in staging_dir.rglob("*.md"):
-        text = md_file.read_text(encoding="utf-8")
-        updated = text
-        for old, new in replacements.items():
-            updated = updated.replace(old, new)
+        updated = DIRECTORY_LINK_RE.sub(replace_directory, updated)
         if updated != text:
             md_file.write_text(updated, encoding="utf-8")
 
@@ -69,7 +69,7 @@ def collect_unused_ignores(
                 location = (Path.cwd() / location).resolve()
             unused[location].add(int(match.group("line")))
             continue
-        if any(line.startswith(prefix) for prefix in SUMMARY_PREFIXES):
+        if line.startswith(SUMMARY_PREFIXES):
             continue
         other_lines.append(raw_line)
 
@@ -101,10 +101,11 @@ def strip_unused_ignores(locations: dict[Path, set[int]]) -> list[str]:
                 line_body = line
                 line_ending = ""
 
-            if TYPE_IGNORE_PATTERN.search(line_body) is None:
+            new_body, removed = TYPE_IGNORE_PATTERN.subn("", line_body)
+            if not removed:
                 continue
 
-            new_body = TYPE_IGNORE_PATTERN.sub("", line_body).rstrip()
+            new_body = new_body.rstrip()
             segments[index] = (new_body + line_ending) if new_body else line_ending
             changed = True
 
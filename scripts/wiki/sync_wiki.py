@@ -10,20 +10,43 @@ wiki. Used by CI and by local verification.
 from __future__ import annotations
 
 import argparse
+import functools
+import os
 import re
 import shutil
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_DEST = REPO_ROOT / "build" / "wiki"
 
+# Links and images in one pass: group 1 holds the "!" that marks an image, and
+# only images may have empty text. Text and targets are bounded so a long run
+# of unclosed brackets costs linear rather than quadratic time.
+_LINK_OR_IMAGE_RE = re.compile(
+    r"(!)?\[((?(1)[^\]]{0,1024}|[^\]]{1,1024}))\]\(([^)]{1,2048})\)"
+)
+_FENCED_RE = re.compile(r"```[\s\S]*?```|~~~[\s\S]*?~~~")
+# Sidebar category keywords, each matched as a substring of the page name.
+_GUIDE_KEYWORDS_RE = re.compile("tutorial|guide|primer|howto|walkthrough")
+_PROJECT_KEYWORDS_RE = re.compile("release|changelog|roadmap|project|architecture")
+# Sidebar sections in display order; _categorize_page returns one of these.
+_SIDEBAR_SECTIONS = ("Guides", "Project", "Additional Pages")
+# Upper bound on threads copying markdown pages in prepare_wiki.
+_MAX_COPY_WORKERS = 8
+# Wiki repository metadata that clear_destination leaves in place.
+_PRESERVED_NAMES = frozenset({".git", ".gitignore", ".gitattributes"})
+# Hyphens and underscores separate words just like whitespace does.
+_WORD_SEPARATORS = str.maketrans("-_", "  ")
+
 
 def _title_case_segment(segment: str) -> str:
-    words = re.split(r"[-_\s]+", segment)
-    return "-".join(word.capitalize() for word in words if word)
+    words = segment.translate(_WORD_SEPARATORS).split()
+    return "-".join(word.capitalize() for word in words)
 
 
+@functools.lru_cache(maxsize=2048)
 def path_to_wiki_name(relative_path: str) -> str:
     """
     Convert a repository-relative path to a wiki page name (no extension).
@@ -34,7 +57,8 @@ def path_to_wiki_name(relative_path: str) -> str:
         README.md -> Home
     """
     path = relative_path.strip().replace("\\", "/")
-    path = re.sub(r"^(?:\./|\.\./)+", "", path)
+    while path.startswith(("./", "../")):
+        path = path[2:] if path.startswith("./") else path[3:]
 
     if path.lower() == "readme.md":
         return "Home"
@@ -45,7 +69,7 @@ def path_to_wiki_name(relative_path: str) -> str:
     if path.endswith(".md"):
         path = path[:-3]
 
-    parts = [part for part in re.split(r"[\\/]+", path) if part]
+    parts = [part for part in path.split("/") if part]
     if not parts:
         return "Page"
 
@@ -59,6 +83,7 @@ def _split_anchor(target: str) -> tuple[str, str]:
     return target, ""
 
 
+@functools.lru_cache(maxsize=2048)
 def transform_link_target(target: str) -> str:
     """
     Turn a relative markdown link target into a wiki link target.
@@ -67,7 +92,8 @@ def transform_link_target(target: str) -> str:
     """
     if target.startswith("#"):
         return target
-    if re.match(r"^[a-zA-Z]+://", target):
+    scheme, separator, _ = target.partition("://")
+    if separator and scheme.isascii() and scheme.isalpha():
         return target
 
     base, anchor = _split_anchor(target)
@@ -81,77 +107,101 @@ def transform_link_target(target: str) -> str:
 def _transform_preserving_code_blocks(
     content: str, transform_fn: Callable[[str], str]
 ) -> str:
-    fenced_pattern = r"(```[\s\S]*?```|~~~[\s\S]*?~~~)"
-    parts = re.split(fenced_pattern, content)
+    if "```" not in content and "~~~" not in content:
+        return transform_fn(content)
 
     result_parts: list[str] = []
-    for index, part in enumerate(parts):
-        if index % 2 == 1:
-            result_parts.append(part)
-        else:
-            result_parts.append(transform_fn(part))
+    position = 0
+    for fence in _FENCED_RE.finditer(content):
+        start = fence.start()
+        if start > position:
+            result_parts.append(transform_fn(content[position:start]))
+        result_parts.append(fence.group())
+        position = fence.end()
+    if position < len(content):
+        result_parts.append(transform_fn(content[position:]))
 
     return "".join(result_parts)
 
 
-def _transform_links_in_text(text: str) -> str:
-    pattern = r"\[([^\]]+)\]\(([^)]+)\)"
-
-    def replace(match: re.Match[str]) -> str:
-        label = match.group(1)
-        target = match.group(2)
-
-        if target.startswith(("http://", "https://", "#", "mailto:", "tel:")):
-            return match.group(0)
-
-        new_target = transform_link_target(target)
-        return f"[{label}]({new_target})"
-
-    return re.sub(pattern, replace, text)
-
-
-def _transform_images_in_text(text: str) -> str:
-    pattern = r"!\[([^\]]*)\]\(([^)]+)\)"
-
+def _transform_links_and_images_in_text(text: str) -> str:
     def replace(match: re.Match[str]) -> str:
-        alt = match.group(1)
-        target = match.group(2)
+        bang, label, target = match.group(1) or "", match.group(2), match.group(3)
 
-        if target.startswith(("http://", "https://", "//", "mailto:", "tel:")):
-            return match.group(0)
+        # Images with text also take the link rewrite, so a markdown target
+        # inside one is renamed exactly as it would be in a plain link.
+        if label and not target.startswith(
+            ("http://", "https://", "#", "mailto:", "tel:")
+        ):
+            target = transform_link_target(target)
 
-        images_index = target.lower().find("images/")
-        if images_index != -1:
-            normalized = target[images_index:]
-            return f"![{alt}]({normalized})"
+        if bang and not target.startswith(
+            ("http://", "https://", "//", "mailto:", "tel:")
+        ):
+            images_index = target.lower().find("images/")
+            if images_index != -1:
+                target = target[images_index:]
 
-        return match.group(0)
+        return f"{bang}[{label}]({target})"
 
-    return re.sub(pattern, replace, text)
+    return _LINK_OR_IMAGE_RE.sub(replace, text)
 
 
 def transform_wiki_links(content: str) -> str:
-    with_links = _transform_preserving_code_blocks(content, _transform_links_in_text)
-    return _transform_preserving_code_blocks(with_links, _transform_images_in_text)
+    return _transform_preserving_code_blocks(
+        content, _transform_links_and_images_in_text
+    )
 
 
-def copy_markdown_file(src: Path, dest: Path) -> None:
-    text = src.read_text(encoding="utf-8")
+def _ensure_parent(path: Path, created_dirs: set[Path] | None) -> None:
+    """Create ``path``'s parent unless ``created_dirs`` says it already exists."""
+    parent = path.parent
+    if created_dirs is not None and parent in created_dirs:
+        return
+    parent.mkdir(parents=True, exist_ok=True)
+    if created_dirs is not None:
+        created_dirs.add(parent)
+
+
+def copy_markdown_file(
+    src: Path, dest: Path, created_dirs: set[Path] | None = None
+) -> None:
+    # Raw bytes skip the text-mode read layer; newlines are normalized the way
+    # read_text's universal newline mode would. Writing stays in text mode so
+    # the platform's newline translation still applies.
+    text = src.read_bytes().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
     transformed = transform_wiki_links(text)
-    dest.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_parent(dest, created_dirs)
     dest.write_text(transformed, encoding="utf-8")
 
 
 def clear_destination(dest_dir: Path) -> None:
     if not dest_dir.exists():
         return
-    for entry in dest_dir.iterdir():
-        if entry.name in {".git", ".gitignore", ".gitattributes"}:
-            continue
-        if entry.is_dir():
-            shutil.rmtree(entry)
-        else:
-            entry.unlink()
+    with os.scandir(dest_dir) as entries:
+        for entry in entries:
+            if entry.name in _PRESERVED_NAMES:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+def _iter_files(root: Path) -> Iterator[Path]:
+    """Yield every file below ``root``, walking it with os.scandir."""
+    pending = [os.fspath(root)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Like rglob, do not descend into symlinked directories.
+                    if not entry.is_symlink():
+                        pending.append(entry.path)
+                else:
+                    yield Path(entry.path)
 
 
 def collect_markdown_sources(source_dir: Path) -> Iterable[tuple[Path, str]]:
@@ -161,25 +211,28 @@ def collect_markdown_sources(source_dir: Path) -> Iterable[tuple[Path, str]]:
         yield source_dir / "README.md", "Home.md"
 
     if docs_dir.exists():
-        for md_file in sorted(docs_dir.rglob("*.md")):
+        markdown_files = (
+            path for path in _iter_files(docs_dir) if path.name.endswith(".md")
+        )
+        for md_file in sorted(markdown_files):
             relative_path = md_file.relative_to(source_dir)
             wiki_name = path_to_wiki_name(str(relative_path)) + ".md"
             yield md_file, wiki_name
 
 
-def copy_images(source_dir: Path, dest_dir: Path) -> int:
+def copy_images(
+    source_dir: Path, dest_dir: Path, created_dirs: set[Path] | None = None
+) -> int:
     docs_dir = source_dir / "docs"
     images_dir = docs_dir / "images"
     if not images_dir.exists():
         return 0
 
     copied = 0
-    for image in images_dir.rglob("*"):
-        if image.is_dir():
-            continue
+    for image in _iter_files(images_dir):
         relative = image.relative_to(images_dir)
         target = dest_dir / "images" / relative
-        target.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_parent(target, created_dirs)
         shutil.copy2(image, target)
         copied += 1
     return copied
@@ -189,13 +242,26 @@ def prepare_wiki(source_dir: Path, dest_dir: Path, clean: bool) -> tuple[int, in
     if clean:
         clear_destination(dest_dir)
     dest_dir.mkdir(parents=True, exist_ok=True)
-
-    pages = 0
-    for src, name in collect_markdown_sources(source_dir):
-        copy_markdown_file(src, dest_dir / name)
-        pages += 1
-
-    images = copy_images(source_dir, dest_dir)
+    # Directories known to exist, so each one is created at most once.
+    created_dirs = {dest_dir}
+
+    sources = list(collect_markdown_sources(source_dir))
+    # Pages are copied on a small thread pool so file I/O overlaps. When two
+    # sources map to the same page the later one wins, as a sequential copy
+    # would leave it, so each destination is written by a single task.
+    final_sources = {name: src for src, name in sources}
+    if final_sources:
+        workers = min(_MAX_COPY_WORKERS, len(final_sources))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            copies = [
+                executor.submit(copy_markdown_file, src, dest_dir / name, created_dirs)
+                for name, src in final_sources.items()
+            ]
+            for copy in copies:
+                copy.result()
+    pages = len(sources)
+
+    images = copy_images(source_dir, dest_dir, created_dirs)
     return pages, images
 
 
@@ -214,50 +280,37 @@ def _categorize_page(stem: str) -> str:
     """
     lower = stem.lower()
 
-    guide_keywords = ("tutorial", "guide", "primer", "howto", "walkthrough")
-    project_keywords = ("release", "changelog", "roadmap", "project", "architecture")
-
-    if any(keyword in lower for keyword in guide_keywords):
+    if _GUIDE_KEYWORDS_RE.search(lower):
         return "Guides"
-    if any(keyword in lower for keyword in project_keywords):
+    if _PROJECT_KEYWORDS_RE.search(lower):
         return "Project"
     return "Additional Pages"
 
 
 def generate_sidebar(dest_dir: Path) -> str:
-    pages = sorted(
-        f.stem
-        for f in dest_dir.glob("*.md")
-        if f.name not in {"_Sidebar.md", "_Footer.md"}
-    )
+    has_home = False
+    categorized: dict[str, list[str]] = {title: [] for title in _SIDEBAR_SECTIONS}
+    for page_file in dest_dir.iterdir():
+        name = page_file.name
+        if not name.endswith(".md") or name in {"_Sidebar.md", "_Footer.md"}:
+            continue
+        page = page_file.stem
+        if page == "Home":
+            has_home = True
+            continue
+        categorized.setdefault(_categorize_page(page), []).append(page)
 
     lines = ["## Documentation", ""]
-
-    if "Home" in pages:
+    if has_home:
         lines.append("- [Home](Home)")
-    categorized: dict[str, list[str]] = {
-        "Guides": [],
-        "Project": [],
-        "Additional Pages": [],
-    }
-    for page in pages:
-        if page == "Home":
-            continue
-        category = _categorize_page(page)
-        categorized.setdefault(category, []).append(page)
 
-    def section(title: str, items: Iterable[str]) -> None:
-        items = sorted(items)
+    for title in _SIDEBAR_SECTIONS:
+        items = categorized[title]
         if not items:
-            return
-        lines.append("")
-        lines.append(f"### {title}")
-        for item in items:
-            lines.append(f"- [{display_name(item)}]({item})")
-
-    section("Guides", categorized.get("Guides", []))
-    section("Project", categorized.get("Project", []))
-    section("Additional Pages", categorized.get("Additional Pages", []))
+            continue
+        items.sort()
+        lines.extend(("", f"### {title}"))
+        lines.extend(f"- [{display_name(item)}]({item})" for item in items)
 
     return "\n".join(lines) + "\n"
 
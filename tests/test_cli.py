@@ -11,12 +11,22 @@ from malbolge.cli.main import main
 
 
 class CLITests(unittest.TestCase):
+    stdout: io.StringIO
+    stderr: io.StringIO
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # One pair of capture buffers, rewound before every invocation.
+        cls.stdout = io.StringIO()
+        cls.stderr = io.StringIO()
+
     def invoke(self, argv: Sequence[str]) -> tuple[int, str, str]:
-        stdout = io.StringIO()
-        stderr = io.StringIO()
-        with redirect_stdout(stdout), redirect_stderr(stderr):
+        for buffer in (self.stdout, self.stderr):
+            buffer.seek(0)
+            buffer.truncate()
+        with redirect_stdout(self.stdout), redirect_stderr(self.stderr):
             exit_code = main(list(argv))
-        return exit_code, stdout.getvalue(), stderr.getvalue()
+        return exit_code, self.stdout.getvalue(), self.stderr.getvalue()
 
     def test_run_command_with_opcodes(self) -> None:
         code, out, err = self.invoke(["run", "--opcodes", "v"])
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 import unittest
 from pathlib import Path
 
@@ -8,31 +9,42 @@ MKDOCS_PATH = REPO_ROOT / "mkdocs.yml"
 TRAILING_SLASH_JS = REPO_ROOT / "docs" / "assets" / "trailing-slash.js"
 
 
-def _load_mkdocs_lines() -> list[str]:
-    return MKDOCS_PATH.read_text(encoding="utf-8").splitlines()
+_SETTING_PATTERNS: dict[str, re.Pattern[str]] = {}
+# The extra_javascript block: list items, blank lines and comments after the key.
+_EXTRA_JAVASCRIPT_RE = re.compile(
+    r"^[ \t]*extra_javascript:[^\n]*\n((?:[ \t]*(?:-[^\n]*|#[^\n]*)?(?:\n|\Z))*)",
+    re.MULTILINE,
+)
 
 
-def _extract_settings(lines: list[str], key: str) -> list[str]:
+def _load_mkdocs_text() -> str:
+    return MKDOCS_PATH.read_text(encoding="utf-8")
+
+
+def _extract_settings(text: str, key: str) -> list[str]:
     """
     Lightweight parser for simple top-level key/value settings in mkdocs.yml.
 
     This intentionally avoids a YAML dependency while providing better
     diagnostics than raw string searching.
     """
-    values: list[str] = []
-    prefix = f"{key}:"
-    for line in lines:
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        if not stripped.startswith(prefix):
-            continue
-        value = stripped.split(":", 1)[1].split("#", 1)[0].strip()
-        values.append(value.strip('"').strip("'"))
-    return values
+    pattern = _SETTING_PATTERNS.get(key)
+    if pattern is None:
+        pattern = re.compile(rf"^[ \t]*{re.escape(key)}:(.*)$", re.MULTILINE)
+        _SETTING_PATTERNS[key] = pattern
+    return [
+        value.split("#", 1)[0].strip().strip('"').strip("'")
+        for value in pattern.findall(text)
+    ]
 
 
 class DocsConfigTests(unittest.TestCase):
+    mkdocs_text: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.mkdocs_text = _load_mkdocs_text()
+
     def test_site_url_configuration(self) -> None:
         """
         Prevent regressions where a missing trailing slash strips the repo path
@@ -40,8 +52,7 @@ class DocsConfigTests(unittest.TestCase):
         Also guard against accidentally pointing site_url at the repository
         view instead of the published GitHub Pages site.
         """
-        lines = _load_mkdocs_lines()
-        site_urls = _extract_settings(lines, "site_url")
+        site_urls = _extract_settings(self.mkdocs_text, "site_url")
         self.assertGreaterEqual(
             len(site_urls),
             1,
@@ -81,27 +92,16 @@ class DocsConfigTests(unittest.TestCase):
             TRAILING_SLASH_JS.exists(), "trailing-slash guard asset is missing"
         )
 
-        lines = _load_mkdocs_lines()
-        in_extra_js = False
-        found = False
-        seen_assets: list[str] = []
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("extra_javascript:"):
-                in_extra_js = True
-                continue
-            if in_extra_js:
-                if stripped.startswith("-"):
-                    asset = stripped.lstrip("-").strip()
-                    seen_assets.append(asset)
-                    if asset == "assets/trailing-slash.js":
-                        found = True
-                        break
-                elif stripped and not stripped.startswith("#"):
-                    # End of extra_javascript block
-                    break
-        self.assertTrue(
-            found,
+        block = _EXTRA_JAVASCRIPT_RE.search(self.mkdocs_text)
+        items = block.group(1).splitlines() if block else []
+        seen_assets = [
+            line.strip().lstrip("-").strip()
+            for line in items
+            if line.strip().startswith("-")
+        ]
+        self.assertIn(
+            "assets/trailing-slash.js",
+            seen_assets,
             "mkdocs.yml must include assets/trailing-slash.js in extra_javascript "
             f"(found: {seen_assets or 'none'})",
         )
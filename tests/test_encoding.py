@@ -3,6 +3,8 @@
 import unittest
 
 from malbolge.encoding import (
+    ENCRYPTION_LUT,
+    ENCRYPTION_TRANSLATE,
     MAX_PROGRAM_LENGTH,
     InvalidProgramError,
     normalize,
@@ -24,6 +26,14 @@ class EncodingTests(unittest.TestCase):
         combined = ascii_prefix + ascii_suffix
         self.assertEqual(normalize(combined), prefix + suffix)
 
+    def test_encryption_lut_matches_translate_table(self) -> None:
+        self.assertEqual(len(ENCRYPTION_LUT), 256)
+        for value in range(256):
+            expected = (
+                ord(ENCRYPTION_TRANSLATE[value - 33]) if 33 <= value <= 126 else value
+            )
+            self.assertEqual(ENCRYPTION_LUT[value], expected)
+
     def test_normalize_max_length_guard(self) -> None:
         with self.assertRaises(InvalidProgramError):
             normalize(["!"] * (MAX_PROGRAM_LENGTH + 1))
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MIT
 
 import unittest
+from itertools import product
 from typing import Any, cast
 
 from malbolge.generator import GenerationConfig, ProgramGenerator
@@ -79,6 +80,81 @@ class GeneratorTests(unittest.TestCase):
         self.assertGreater(result.stats["repeated_state_pruned"], 0)
         self.assertGreater(result.stats["repeated_state_ratio"], 0.0)
 
+    def test_repeated_sibling_states_still_expand(self) -> None:
+        # Halting siblings share a patched fallback signature, so several
+        # candidates per layer are pruned as repeated states; the next layer
+        # must still extend every base, exactly like a search without them.
+        generator = ProgramGenerator()
+        original_signature = vars(ProgramGenerator)["_fallback_signature"]
+        patched_generator = cast(Any, ProgramGenerator)
+        try:
+            patched_generator._fallback_signature = staticmethod(
+                lambda machine: (len(machine.tape), 0, 0, 0, ())
+            )
+            result = generator.generate_for_string(
+                "t",
+                config=GenerationConfig(opcode_choices="op*v", capture_trace=True),
+            )
+        finally:
+            patched_generator._fallback_signature = original_signature
+
+        self.assertTrue(result.opcodes.endswith("*op<v"))
+        self.assertGreater(result.stats["repeated_state_pruned"], 0)
+        for depth in (1, 2, 3):
+            layer = ["".join(ops) + "<" for ops in product("op*v", repeat=depth)]
+            if depth == 3:
+                layer = layer[: layer.index("*op<") + 1]
+            evaluated = [
+                event["candidate"] for event in result.trace if event["depth"] == depth
+            ]
+            with self.subTest(depth=depth):
+                self.assertEqual(evaluated, layer)
+        self.assertEqual(result.stats["evaluations"], 4 + 16 + 34 + 1)
+
+    def test_bounded_state_cache_preserves_result(self) -> None:
+        baseline = ProgramGenerator().generate_for_string(
+            "Hi", config=GenerationConfig(random_seed=42)
+        )
+        bounded = ProgramGenerator().generate_for_string(
+            "Hi", config=GenerationConfig(random_seed=42, state_cache_capacity=1)
+        )
+        self.assertEqual(bounded.opcodes, baseline.opcodes)
+        self.assertEqual(bounded.machine_output, "Hi")
+
+    def test_invalid_state_cache_capacity_rejected(self) -> None:
+        generator = ProgramGenerator()
+        with self.assertRaises(ValueError):
+            generator.generate_for_string(
+                "Hi", config=GenerationConfig(state_cache_capacity=0)
+            )
+
+    def test_parallel_workers_match_serial_result(self) -> None:
+        serial = ProgramGenerator().generate_for_string(
+            "Hi", config=GenerationConfig(random_seed=42)
+        )
+        parallel = ProgramGenerator().generate_for_string(
+            "Hi", config=GenerationConfig(random_seed=42, parallel_workers=2)
+        )
+        self.assertEqual(parallel.opcodes, serial.opcodes)
+        self.assertEqual(parallel.machine_output, "Hi")
+
+    def test_invalid_parallel_workers_rejected(self) -> None:
+        generator = ProgramGenerator()
+        with self.assertRaises(ValueError):
+            generator.generate_for_string(
+                "Hi", config=GenerationConfig(parallel_workers=0)
+            )
+
+    def test_frontier_templates_are_cached_per_alphabet(self) -> None:
+        generator = ProgramGenerator()
+        layer = generator._frontier_template("op", 2)
+        self.assertEqual(layer, ("oo", "op", "po", "pp"))
+        self.assertIs(generator._frontier_template("op", 2), layer)
+        self.assertEqual(generator._frontier_template("op", 1), ("o", "p"))
+        # 2**13 candidates exceed the cache bound, so that layer is not kept.
+        self.assertIsNone(generator._frontier_template("op", 13))
+        self.assertEqual(len(generator._frontier_templates["op"]), 2)
+
     def test_capture_trace_records_events(self) -> None:
         generator = ProgramGenerator()
         config = GenerationConfig(random_seed=1234, capture_trace=True)
@@ -89,6 +165,8 @@ class GeneratorTests(unittest.TestCase):
         self.assertIn("candidate", first_event)
         self.assertIn("reason", first_event)
         self.assertIn("pruned", first_event)
+        self.assertEqual(first_event["target_prefix"], "H")
+        self.assertEqual(result.trace[-1]["target_prefix"], "Hi")
 
 
 if __name__ == "__main__":
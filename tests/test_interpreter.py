@@ -1,7 +1,9 @@
 # SPDX-License-Identifier: MIT
 
+import itertools
 import threading
 import unittest
+from array import array
 from collections.abc import Iterable
 from concurrent.futures import ThreadPoolExecutor
 from types import MethodType
@@ -39,16 +41,66 @@ class InterpreterTests(unittest.TestCase):
         self.assertEqual(result.memory_expansions, 0)
         self.assertGreaterEqual(result.peak_memory_cells, 1)
 
+    def test_machine_tape_is_packed(self) -> None:
+        machine = MalbolgeMachine(tape=[33, 66])
+        self.assertIsInstance(machine.tape, array)
+        self.assertEqual(list(machine.tape), [33, 66])
+        clone = machine.copy()
+        clone.tape[0] = 59048
+        self.assertEqual(machine.tape[0], 33)
+
     def test_input_instruction_consumes_buffer(self) -> None:
         interpreter = MalbolgeInterpreter()
         result = interpreter.execute("/<v", input_buffer=["A"])
         self.assertEqual(result.output, "A")
 
+    def test_load_tape_stores_character_codes(self) -> None:
+        machine = MalbolgeMachine()
+        machine.load_tape(["(", "=", "~"])
+        self.assertEqual(list(machine.tape), [40, 61, 126])
+        machine.load_tape("'&")
+        self.assertEqual(list(machine.tape), [39, 38])
+
+    def test_repeated_program_loads_fresh_tape(self) -> None:
+        opcodes = "p*jo" * 5 + "<v"
+        first = MalbolgeInterpreter().execute(opcodes, capture_machine=True)
+        second = MalbolgeInterpreter().execute(opcodes, capture_machine=True)
+        from_list = MalbolgeInterpreter().execute(list(opcodes), capture_machine=True)
+        self.assertEqual(second, first)
+        self.assertEqual(from_list, first)
+
+    def test_input_buffer_uses_first_character_of_each_item(self) -> None:
+        interpreter = MalbolgeInterpreter()
+        result = interpreter.execute("/</<v", input_buffer=["AB", "C"])
+        self.assertEqual(result.output, "AC")
+        self.assertEqual(interpreter.execute("/</<v", input_buffer="XY").output, "XY")
+
+    def test_empty_input_item_raises(self) -> None:
+        interpreter = MalbolgeInterpreter()
+        with self.assertRaises(InputUnderflowError):
+            interpreter.execute("/<v", input_buffer=[""])
+
     def test_input_underflow_raises(self) -> None:
         interpreter = MalbolgeInterpreter()
         with self.assertRaises(InputUnderflowError):
             interpreter.execute("/v")
 
+    def test_lazy_input_buffer_is_read_on_demand(self) -> None:
+        interpreter = MalbolgeInterpreter()
+        result = interpreter.execute("/</<v", input_buffer=itertools.repeat("A"))
+        self.assertEqual(result.output, "AA")
+
+        hooked = MalbolgeInterpreter()
+        cast(Any, hooked)._instruction_at = MethodType(
+            MalbolgeInterpreter._instruction_at, hooked
+        )
+        self.assertEqual(hooked.run("/<v", input_buffer=itertools.repeat("B")), "B")
+
+        with self.assertRaises(InputUnderflowError):
+            interpreter.execute("/</<v", input_buffer=iter(["A"]))
+        with self.assertRaises(InputUnderflowError):
+            interpreter.execute("/<v", input_buffer=(item for item in [""]))
+
     def test_execute_from_snapshot_extends_program(self) -> None:
         interpreter = MalbolgeInterpreter()
         base = interpreter.execute("ov", capture_machine=True)
@@ -69,16 +121,45 @@ class InterpreterTests(unittest.TestCase):
         self.assertEqual(extended.halt_metadata.last_instruction, "v")
         self.assertEqual(extended.memory_expansions, 0)
 
+    def test_hooked_dispatch_matches_core_loop(self) -> None:
+        opcodes = "i" + "o" * 99 + "p<*<jo<v"
+        core = MalbolgeInterpreter().execute(opcodes, capture_machine=True)
+
+        hooked_interpreter = MalbolgeInterpreter()
+        cast(Any, hooked_interpreter)._instruction_at = MethodType(
+            MalbolgeInterpreter._instruction_at, hooked_interpreter
+        )
+        hooked = hooked_interpreter.execute(opcodes, capture_machine=True)
+
+        self.assertEqual(hooked.output, core.output)
+        self.assertEqual(hooked.steps, core.steps)
+        self.assertEqual(hooked.halt_reason, core.halt_reason)
+        self.assertEqual(hooked.machine, core.machine)
+        self.assertEqual(hooked.halt_metadata, core.halt_metadata)
+        self.assertEqual(hooked.memory_expansions, core.memory_expansions)
+
     def test_invalid_opcode_raises(self) -> None:
         interpreter = MalbolgeInterpreter()
         with self.assertRaises(InvalidOpcodeError):
             interpreter.execute("z")
 
+    def test_multi_character_opcode_rejected(self) -> None:
+        interpreter = MalbolgeInterpreter()
+        with self.assertRaises(InvalidOpcodeError):
+            interpreter.execute(["</", "v"])
+
     def test_step_limit_exceeded(self) -> None:
         interpreter = MalbolgeInterpreter()
         with self.assertRaises(StepLimitExceededError):
             interpreter.execute("v", max_steps=0)
 
+    def test_step_limit_interrupts_nop_run(self) -> None:
+        interpreter = MalbolgeInterpreter()
+        with self.assertRaises(StepLimitExceededError):
+            interpreter.execute("o" * 50 + "v", max_steps=20)
+        self.assertEqual(interpreter.machine.c, 20)
+        self.assertEqual(interpreter.machine.d, 20)
+
     def test_memory_limit_enforced_when_disabled(self) -> None:
         interpreter = MalbolgeInterpreter(allow_memory_expansion=False)
         base = MalbolgeInterpreter().execute("ov", capture_machine=True)
@@ -187,6 +268,39 @@ class InterpreterTests(unittest.TestCase):
         self.assertFalse(result.halt_metadata.cycle_tracking_limited)
         self.assertEqual(result.halt_reason, "halt_opcode")
 
+    def test_cycle_detection_limit_bounds_loop_length(self) -> None:
+        def run_period_three_loop(cycle_limit: int) -> ExecutionResult:
+            interpreter = MalbolgeInterpreter(cycle_detection_limit=cycle_limit)
+            machine = MalbolgeMachine(tape=[33, 33, 33])
+            interpreter.machine = machine
+            interpreter._program_length = 3
+            interpreter._reset_diagnostics()
+            calls = iter(range(20))
+
+            def fake_instruction(self: MalbolgeInterpreter, index: int) -> str:
+                return "o" if next(calls, None) is not None else "v"
+
+            def fake_encrypt(self: MalbolgeMachine) -> None:
+                # Step c through 0, 1, 2 forever while d stays put.
+                self.c = (self.c + 1) % 3 - 1
+                self.d = -1
+
+            cast(Any, interpreter)._instruction_at = MethodType(
+                fake_instruction, interpreter
+            )
+            cast(Any, machine).encrypt_current_cell = MethodType(fake_encrypt, machine)
+            return interpreter.resume_execution()
+
+        tracked = run_period_three_loop(5)
+        self.assertTrue(tracked.halt_metadata.cycle_detected)
+        self.assertEqual(tracked.halt_metadata.cycle_repeat_length, 3)
+        self.assertFalse(tracked.halt_metadata.cycle_tracking_limited)
+
+        limited = run_period_three_loop(2)
+        self.assertFalse(limited.halt_metadata.cycle_detected)
+        self.assertIsNone(limited.halt_metadata.cycle_repeat_length)
+        self.assertTrue(limited.halt_metadata.cycle_tracking_limited)
+
     def test_jump_instruction_expands_capacity(self) -> None:
         interpreter = MalbolgeInterpreter()
         result = interpreter.execute("iv", capture_machine=True)
@@ -247,6 +361,36 @@ class InterpreterTests(unittest.TestCase):
             results = list(executor.map(execute_program, range(8)))
         self.assertTrue(all(result == "" for result in results))
 
+    def test_execute_batch_matches_individual_runs(self) -> None:
+        programs = ["v", "/<v", "ooooo", "*<v"]
+        expected = []
+        for program in programs:
+            result = MalbolgeInterpreter().execute(
+                program, input_buffer=["Q"], max_steps=100
+            )
+            expected.append((result.output, result.steps, result.halt_reason))
+
+        interpreter = MalbolgeInterpreter()
+        serial = interpreter.execute_batch(
+            programs, input_buffer=iter(["Q"]), max_steps=100
+        )
+        parallel = interpreter.execute_batch(
+            programs, input_buffer=["Q"], max_steps=100, parallel_workers=2
+        )
+        for results in (serial, parallel):
+            self.assertEqual(
+                [(r.output, r.steps, r.halt_reason) for r in results], expected
+            )
+
+    def test_execute_batch_rejects_invalid_workers(self) -> None:
+        with self.assertRaises(ValueError):
+            MalbolgeInterpreter().execute_batch(["v"], parallel_workers=0)
+
+    def test_unlocked_interpreter_runs_programs(self) -> None:
+        interpreter = MalbolgeInterpreter(thread_safe=False)
+        self.assertEqual(interpreter.execute("v").halt_reason, "halt_opcode")
+        self.assertEqual(interpreter.run("/<v", input_buffer=["Q"]), "Q")
+
     def test_shared_interpreter_serializes_threads(self) -> None:
         interpreter = MalbolgeInterpreter()
         original = interpreter._execute_loaded
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.check_markdown_links import validate_file
+
+
+class MarkdownLinkTests(unittest.TestCase):
+    def validate(self, content: str) -> list[str]:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "page.md"
+            path.write_text(content, encoding="utf-8")
+            return validate_file(path)
+
+    def test_descriptive_links_pass(self) -> None:
+        content = "See the [project primer](docs/MALBOLGE_PRIMER.md) and [guide][1].\n"
+        self.assertEqual(self.validate(content), [])
+
+    def test_fenced_code_is_ignored(self) -> None:
+        content = "```\n[here](https://example.com)\n```\n"
+        self.assertEqual(self.validate(content), [])
+
+    def test_overlapping_reference_and_inline_links_are_both_checked(self) -> None:
+        # The reference match ``[x][here]`` overlaps the inline ``[here](...)``.
+        errors = self.validate("[x][here](https://a.b)\n")
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Inline link text 'here' should be descriptive.", errors[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: MIT
+
+import unittest
+
+from malbolge.utils import (
+    TERNARY_DIGITS,
+    convert_to_base3,
+    convert_to_base10,
+    crazy_operation,
+)
+
+
+def digitwise_crazy(first: int, second: int) -> int:
+    truth_table = ((1, 0, 0), (1, 0, 2), (2, 2, 1))
+    total = 0
+    power = 1
+    for _ in range(TERNARY_DIGITS):
+        total += truth_table[second % 3][first % 3] * power
+        first //= 3
+        second //= 3
+        power *= 3
+    return total
+
+
+class UtilsTests(unittest.TestCase):
+    def test_crazy_operation_matches_digitwise_definition(self) -> None:
+        samples = [0, 1, 2, 33, 126, 242, 243, 29524, 59047, 59048]
+        for first in samples:
+            for second in samples:
+                with self.subTest(first=first, second=second):
+                    self.assertEqual(
+                        crazy_operation(first, second),
+                        digitwise_crazy(first, second),
+                    )
+
+    def test_base_conversions_round_trip(self) -> None:
+        for value in (0, 1, 2, 3, 242, 243, 29524, 59048):
+            with self.subTest(value=value):
+                digits = convert_to_base3(value)
+                self.assertEqual(len(digits), TERNARY_DIGITS)
+                self.assertEqual(convert_to_base10(digits), value)
+        self.assertEqual(convert_to_base3(59049 + 5), convert_to_base3(5))
+        self.assertEqual(convert_to_base3(5, digits=3), [2, 1, 0])
+        self.assertEqual(convert_to_base10([2, 1, 0]), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,8 +16,23 @@ from scripts.wiki.sync_wiki import (
 
 
 class WikiSyncTests(unittest.TestCase):
+    session_dir: Path
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Every test works in its own subdirectory of one class-wide temp dir,
+        # which is removed in a single pass afterwards.
+        cls.session_dir = Path(tempfile.mkdtemp())
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.session_dir, ignore_errors=True)
+
+    def make_temp_dir(self) -> Path:
+        return Path(tempfile.mkdtemp(dir=self.session_dir))
+
     def create_source_tree(self) -> tuple[Path, Path]:
-        src_dir = Path(tempfile.mkdtemp())
+        src_dir = self.make_temp_dir()
         docs_dir = src_dir / "docs"
         docs_dir.mkdir(parents=True, exist_ok=True)
 
@@ -35,16 +50,9 @@ class WikiSyncTests(unittest.TestCase):
         images_dir.mkdir(parents=True, exist_ok=True)
         (images_dir / "logo.png").write_bytes(b"image-bytes")
 
-        dest_dir = Path(tempfile.mkdtemp())
+        dest_dir = self.make_temp_dir()
         return src_dir, dest_dir
 
-    def tearDown(self) -> None:
-        # Clean up temp directories if a test created them
-        for attr in ("src_dir", "dest_dir"):
-            directory = getattr(self, attr, None)
-            if directory and Path(directory).exists():
-                shutil.rmtree(directory, ignore_errors=True)
-
     def test_path_to_wiki_name_normalizes_paths(self) -> None:
         cases = {
             "docs/TUTORIAL.md": "Tutorial",
@@ -70,6 +78,27 @@ class WikiSyncTests(unittest.TestCase):
         transformed = transform_wiki_links(content)
         self.assertIn("![logo](images/logo.png)", transformed)
 
+    def test_transform_wiki_links_handles_links_and_images_together(self) -> None:
+        content = (
+            "![logo](../docs/images/logo.png) see the [primer](docs/MALBOLGE_PRIMER.md)"
+            " and ![](images/empty.png) but not [](docs/TUTORIAL.md)"
+        )
+        transformed = transform_wiki_links(content)
+        self.assertEqual(
+            transformed,
+            "![logo](images/logo.png) see the [primer](Malbolge-Primer)"
+            " and ![](images/empty.png) but not [](docs/TUTORIAL.md)",
+        )
+
+    def test_transform_wiki_links_handles_unclosed_brackets(self) -> None:
+        # Quadratic backtracking over this line would take minutes.
+        brackets = "[" * 100_000
+        content = brackets + "\n\nSee the [primer](docs/MALBOLGE_PRIMER.md)."
+        transformed = transform_wiki_links(content)
+        self.assertEqual(
+            transformed, brackets + "\n\nSee the [primer](Malbolge-Primer)."
+        )
+
     def test_transform_wiki_links_ignores_mailto_and_tel_images(self) -> None:
         content = "![email](mailto:team@example.com) ![phone](tel:+123456)"
         transformed = transform_wiki_links(content)
@@ -91,7 +120,7 @@ class WikiSyncTests(unittest.TestCase):
         self.assertIn("[Tutorial](Tutorial)", sidebar)
 
     def test_generate_sidebar_categorizes_by_keyword(self) -> None:
-        self.dest_dir = Path(tempfile.mkdtemp())
+        self.dest_dir = self.make_temp_dir()
         for name in [
             "Home.md",
             "Tutorial.md",
@@ -117,7 +146,7 @@ class WikiSyncTests(unittest.TestCase):
         self.assertIn("[Misc](Misc)", sidebar)
 
     def test_clear_destination_preserves_git_metadata(self) -> None:
-        self.dest_dir = Path(tempfile.mkdtemp())
+        self.dest_dir = self.make_temp_dir()
         (self.dest_dir / ".git").mkdir()
         (self.dest_dir / ".gitignore").write_text("*.tmp", encoding="utf-8")
         (self.dest_dir / ".gitattributes").write_text("* text=auto", encoding="utf-8")